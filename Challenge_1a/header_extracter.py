@@ -1,40 +1,93 @@
 import fitz  # PyMuPDF
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import groupby, repeat
 import json
+import logging
+import multiprocessing
+from operator import itemgetter
+import os
+import re
 
-def truncate_middle(text, max_len=40):
+# tabulate is only needed by the metadata table debug dumps, so it stays optional
+try:
+    from tabulate import tabulate
+except ImportError:
+    tabulate = None
+
+# Text extraction flags for page.get_text("dict"): the default dict flags minus image
+# extraction, since image blocks are skipped anyway and decoding them is costly
+TEXT_EXTRACTION_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+log = logging.getLogger(__name__)
+
+# Documents with more pages than this have their spans extracted by several worker processes
+PARALLEL_PAGE_THRESHOLD = 50
+
+# Any alphanumeric character (Unicode-aware: equivalent to str.isalnum per character)
+ALNUM_RE = re.compile(r'[^\W_]')
+
+# Per-column tabulate float formats for pretty_print_metadata: two decimals for size and
+# bbox columns, default formatting (matching the unrounded text columns) elsewhere
+PRETTY_PRINT_FLOATFMT = ("g", "g", ".2f", ".2f", ".2f", ".2f", ".2f", "g")
+
+# Default width of the text column in pretty_print_metadata, and the characters kept on
+# each side of the "..." when truncating to it
+TRUNCATE_MAX_LEN = 40
+TRUNCATE_KEEP = TRUNCATE_MAX_LEN // 2 - 2
+
+def truncate_middle(text, max_len=TRUNCATE_MAX_LEN):
     if len(text) <= max_len:
         return text
-    keep = max_len // 2 - 2
+    keep = TRUNCATE_KEEP if max_len == TRUNCATE_MAX_LEN else max_len // 2 - 2
     return f"{text[:keep]}...{text[-keep:]}"
 
 
-def pretty_print_metadata(data):
-    from tabulate import tabulate
+def format_metadata_table(data):
+    """Render the text, bold, size, bbox and centered info of the spans as a grid table."""
+    if tabulate is None:
+        raise ImportError("format_metadata_table requires the tabulate package")
 
-    table_data = []
-    for item in data:
-        table_data.append([
+    # Numeric columns are passed through as-is and rounded by tabulate's per-column float format
+    table_data = [
+        [
             truncate_middle(item['text']),
             '✔' if item['bold'] else '❌',
-            round(item['size'], 2),
-            round(item['x0'], 2),
-            round(item['y0'], 2),
-            round(item['x1'], 2),
-            round(item['y1'], 2),
+            item['size'],
+            item['x0'],
+            item['y0'],
+            item['x1'],
+            item['y1'],
             '✔' if item['centered'] else '❌'
-        ])
+        ]
+        for item in data
+    ]
 
     headers = ['Text', 'Bold', 'Size', 'x0', 'y0', 'x1', 'y1', 'Centered']
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    return tabulate(table_data, headers=headers, tablefmt="grid", floatfmt=PRETTY_PRINT_FLOATFMT)
+
+
+def pretty_print_metadata(data):
+    print(format_metadata_table(data))
 
 
 def is_meaningful_text(text):
     """Check if text contains at least one alphabet or number."""
-    return any(char.isalnum() for char in text)
+    return ALNUM_RE.search(text) is not None
+
 
+@lru_cache(maxsize=128)
+def is_bold_font(font):
+    """Check if a font name denotes a bold face. A document only embeds a handful of
+    fonts, so the lowercasing runs once per distinct font name ('Bold' in the name is
+    covered by the case-insensitive check)."""
+    return 'bold' in font.lower()
 
-def detect_tables_in_page(text_spans, page_width, page_height, alignment_threshold=5.0, min_columns=2, min_rows=2):
+
+def detect_tables_in_page(text_spans, page_width, page_height, alignment_threshold=5.0, min_columns=2, min_rows=2, span_bounds=None):
     """
     Detect table regions in a page based on text alignment patterns.
     
@@ -45,51 +98,45 @@ def detect_tables_in_page(text_spans, page_width, page_height, alignment_thresho
         alignment_threshold: Threshold for considering text aligned (in points)
         min_columns: Minimum number of columns to consider as a table
         min_rows: Minimum number of rows to consider as a table
+        span_bounds: Optional list of (x0, y0, x1, y1) tuples parallel to text_spans,
+                     built once per page by the caller and shared with find_spans_in_tables
     
     Returns:
         List of table regions as dictionaries with 'x0', 'y0', 'x1', 'y1' coordinates
     """
-    if not text_spans:
+    # A table needs at least min_rows spans in each of min_columns columns, so sparse
+    # pages (title pages, dividers, blank pages) can't contain one
+    if len(text_spans) < min_columns * min_rows:
         return []
     
-    # Group text spans by approximate horizontal positions (columns)
-    x_positions = {}
-    for span in text_spans:
-        x0 = span['x0']
-        # Round to nearest alignment threshold to group nearby x positions
-        aligned_x = round(x0 / alignment_threshold) * alignment_threshold
-        if aligned_x not in x_positions:
-            x_positions[aligned_x] = []
-        x_positions[aligned_x].append(span)
-    
+    if span_bounds is None:
+        span_bounds = [(span['x0'], span['y0'], span['x1'], span['y1']) for span in text_spans]
+
+    # Round every span to the alignment grid once; these parallel lists are reused
+    # for column/row counting and for assigning spans to table regions below
+    aligned_xs = [round(bounds[0] / alignment_threshold) * alignment_threshold for bounds in span_bounds]
+    aligned_ys = [round(bounds[1] / alignment_threshold) * alignment_threshold for bounds in span_bounds]
+
     # Filter out x positions with too few elements (not likely to be columns)
-    potential_columns = {x: spans for x, spans in x_positions.items() if len(spans) >= min_rows}
-    
+    x_counts = Counter(aligned_xs)
+    potential_columns = [x for x, count in x_counts.items() if count >= min_rows]
+
     if len(potential_columns) < min_columns:
         return []  # Not enough columns to form a table
-    
-    # Group spans by approximate vertical positions (rows)
-    y_positions = {}
-    for span in text_spans:
-        y0 = span['y0']
-        # Round to nearest alignment threshold to group nearby y positions
-        aligned_y = round(y0 / alignment_threshold) * alignment_threshold
-        if aligned_y not in y_positions:
-            y_positions[aligned_y] = []
-        y_positions[aligned_y].append(span)
-    
+
     # Filter out y positions with too few elements (not likely to be rows)
-    potential_rows = {y: spans for y, spans in y_positions.items() if len(spans) >= min_columns}
-    
+    y_counts = Counter(aligned_ys)
+    potential_rows = [y for y, count in y_counts.items() if count >= min_columns]
+
     if len(potential_rows) < min_rows:
         return []  # Not enough rows to form a table
-    
+
     # Find grid intersections - areas where multiple columns and rows intersect
     table_regions = []
-    
+
     # Group consecutive columns and rows to identify table regions
-    sorted_x_positions = sorted(potential_columns.keys())
-    sorted_y_positions = sorted(potential_rows.keys())
+    sorted_x_positions = sorted(potential_columns)
+    sorted_y_positions = sorted(potential_rows)
     
     # Look for groups of consecutive aligned positions
     x_groups = []
@@ -120,24 +167,45 @@ def detect_tables_in_page(text_spans, page_width, page_height, alignment_thresho
     if len(current_y_group) >= min_rows:
         y_groups.append(current_y_group)
     
+    # Assign every span to its (x_group, y_group) grid cell in a single pass. Groups are
+    # disjoint, so each aligned position maps to at most one group index.
+    x_group_index = {x: i for i, x_group in enumerate(x_groups) for x in x_group}
+    y_group_index = {y: i for i, y_group in enumerate(y_groups) for y in y_group}
+    
+    # Only the span count and the extent of each cell are needed, so accumulate those
+    # directly instead of collecting per-cell span lists
+    cell_stats = {}  # (x_index, y_index) -> [span_count, min_x, max_x, min_y, max_y]
+    for (x0, y0, x1, y1), span_x, span_y in zip(span_bounds, aligned_xs, aligned_ys):
+        x_index = x_group_index.get(span_x)
+        if x_index is None:
+            continue
+        y_index = y_group_index.get(span_y)
+        if y_index is None:
+            continue
+        
+        stats = cell_stats.get((x_index, y_index))
+        if stats is None:
+            cell_stats[(x_index, y_index)] = [1, x0, x1, y0, y1]
+        else:
+            stats[0] += 1
+            if x0 < stats[1]:
+                stats[1] = x0
+            if x1 > stats[2]:
+                stats[2] = x1
+            if y0 < stats[3]:
+                stats[3] = y0
+            if y1 > stats[4]:
+                stats[4] = y1
+    
     # Create table regions from x and y groups
-    for x_group in x_groups:
-        for y_group in y_groups:
-            # Get all spans in this potential table region
-            table_spans = []
-            for span in text_spans:
-                span_x = round(span['x0'] / alignment_threshold) * alignment_threshold
-                span_y = round(span['y0'] / alignment_threshold) * alignment_threshold
-                if span_x in x_group and span_y in y_group:
-                    table_spans.append(span)
+    for x_index in range(len(x_groups)):
+        for y_index in range(len(y_groups)):
+            stats = cell_stats.get((x_index, y_index))
             
             # If we have enough spans in a grid pattern, consider it a table
-            if len(table_spans) >= min_columns * min_rows:
+            if stats is not None and stats[0] >= min_columns * min_rows:
                 # Calculate table bounds
-                min_x = min(span['x0'] for span in table_spans)
-                max_x = max(span['x1'] for span in table_spans)
-                min_y = min(span['y0'] for span in table_spans)
-                max_y = max(span['y1'] for span in table_spans)
+                span_count, min_x, max_x, min_y, max_y = stats
                 
                 # Add some padding around the detected table
                 padding = 10
@@ -146,32 +214,43 @@ def detect_tables_in_page(text_spans, page_width, page_height, alignment_thresho
                     'y0': max(0, min_y - padding),
                     'x1': min(page_width, max_x + padding),
                     'y1': min(page_height, max_y + padding),
-                    'span_count': len(table_spans)
+                    'span_count': span_count
                 }
                 table_regions.append(table_region)
     
-    # Remove overlapping table regions (keep the one with more spans)
+    # Remove overlapping table regions (keep the one with more spans).
+    # Sweep over the regions sorted by x0 so each region is only compared against
+    # the candidates whose x-extent can actually intersect its own.
+    region_areas = [(r['x1'] - r['x0']) * (r['y1'] - r['y0']) for r in table_regions]
+    order = sorted(range(len(table_regions)), key=lambda k: table_regions[k]['x0'])
+    sorted_x0s = [table_regions[k]['x0'] for k in order]
+
     filtered_regions = []
     for i, region1 in enumerate(table_regions):
+        region1_area = region_areas[i]
+        if region1_area <= 0:
+            filtered_regions.append(region1)
+            continue
+
         is_overlapped = False
-        for j, region2 in enumerate(table_regions):
-            if i != j:
-                # Check if regions overlap significantly
-                overlap_x = max(0, min(region1['x1'], region2['x1']) - max(region1['x0'], region2['x0']))
-                overlap_y = max(0, min(region1['y1'], region2['y1']) - max(region1['y0'], region2['y0']))
-                overlap_area = overlap_x * overlap_y
-                
-                region1_area = (region1['x1'] - region1['x0']) * (region1['y1'] - region1['y0'])
-                overlap_ratio = overlap_area / region1_area if region1_area > 0 else 0
-                
-                if overlap_ratio > 0.5:  # 50% overlap
-                    if region2['span_count'] > region1['span_count']:
-                        is_overlapped = True
-                        break
-        
+        # Only regions starting left of region1's right edge can overlap it
+        for j in order[:bisect_left(sorted_x0s, region1['x1'])]:
+            region2 = table_regions[j]
+            if j == i or region2['x1'] <= region1['x0'] or region2['span_count'] <= region1['span_count']:
+                continue
+
+            # Check if regions overlap significantly
+            overlap_x = max(0, min(region1['x1'], region2['x1']) - max(region1['x0'], region2['x0']))
+            overlap_y = max(0, min(region1['y1'], region2['y1']) - max(region1['y0'], region2['y0']))
+            overlap_area = overlap_x * overlap_y
+
+            if overlap_area / region1_area > 0.5:  # 50% overlap
+                is_overlapped = True
+                break
+
         if not is_overlapped:
             filtered_regions.append(region1)
-    
+
     return filtered_regions
 
 
@@ -188,28 +267,157 @@ def is_text_in_table(text_span, table_regions, overlap_threshold=0.3):
     Returns:
         Boolean indicating whether the text span is within a table
     """
-    span_x0, span_y0, span_x1, span_y1 = text_span['x0'], text_span['y0'], text_span['x1'], text_span['y1']
-    span_area = (span_x1 - span_x0) * (span_y1 - span_y0)
+    span_bounds = (text_span['x0'], text_span['y0'], text_span['x1'], text_span['y1'])
+    return find_spans_in_tables([span_bounds], table_regions, overlap_threshold)[0]
+
+
+def find_spans_in_tables(span_bounds, table_regions, overlap_threshold=0.3):
+    """
+    Batch version of is_text_in_table: check every text span of a page against all
+    table regions in one pass, unpacking the table bounds only once.
+    
+    Args:
+        span_bounds: List of (x0, y0, x1, y1) tuples, one per text span
+        table_regions: List of table region dictionaries
+        overlap_threshold: Minimum overlap ratio required (0.3 = 30% of span must overlap)
+    
+    Returns:
+        List of booleans, one per text span, indicating whether the span is within a table
+    """
+    if not table_regions:
+        return [False] * len(span_bounds)
+    
+    # Tables sorted by top edge: a table can only overlap a span if it starts above the
+    # span's bottom edge, so each span only scans the prefix found by bisection
+    table_bounds = sorted(((table['x0'], table['y0'], table['x1'], table['y1']) for table in table_regions),
+                          key=lambda bounds: bounds[1])
+    table_y0s = [bounds[1] for bounds in table_bounds]
+    
+    # Envelope of all tables: spans that don't overlap it can't overlap any single table
+    envelope_x0 = min(bounds[0] for bounds in table_bounds)
+    envelope_y0 = min(bounds[1] for bounds in table_bounds)
+    envelope_x1 = max(bounds[2] for bounds in table_bounds)
+    envelope_y1 = max(bounds[3] for bounds in table_bounds)
+    
+    in_table_flags = []
     
-    for table in table_regions:
-        table_x0, table_y0, table_x1, table_y1 = table['x0'], table['y0'], table['x1'], table['y1']
+    for span_x0, span_y0, span_x1, span_y1 in span_bounds:
+        in_table = False
         
-        # Calculate overlap area
-        overlap_x0 = max(span_x0, table_x0)
-        overlap_y0 = max(span_y0, table_y0)
-        overlap_x1 = min(span_x1, table_x1)
-        overlap_y1 = min(span_y1, table_y1)
+        if (span_x1 <= envelope_x0 or span_x0 >= envelope_x1 or
+                span_y1 <= envelope_y0 or span_y0 >= envelope_y1):
+            in_table_flags.append(in_table)
+            continue
+        
+        span_area = (span_x1 - span_x0) * (span_y1 - span_y0)
         
-        # Check if there's actual overlap (not just touching)
-        if overlap_x0 < overlap_x1 and overlap_y0 < overlap_y1:
-            overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
-            overlap_ratio = overlap_area / span_area if span_area > 0 else 0
+        for table_index in range(bisect_left(table_y0s, span_y1)):
+            table_x0, table_y0, table_x1, table_y1 = table_bounds[table_index]
+            # Calculate overlap area
+            overlap_x0 = max(span_x0, table_x0)
+            overlap_y0 = max(span_y0, table_y0)
+            overlap_x1 = min(span_x1, table_x1)
+            overlap_y1 = min(span_y1, table_y1)
             
-            # Only consider it "in table" if substantial overlap (e.g., 30% of the text span)
-            if overlap_ratio >= overlap_threshold:
-                return True
+            # Check if there's actual overlap (not just touching)
+            if overlap_x0 < overlap_x1 and overlap_y0 < overlap_y1:
+                overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
+                overlap_ratio = overlap_area / span_area if span_area > 0 else 0
+                
+                # Only consider it "in table" if substantial overlap (e.g., 30% of the text span)
+                if overlap_ratio >= overlap_threshold:
+                    in_table = True
+                    break
+        
+        in_table_flags.append(in_table)
     
-    return False
+    return in_table_flags
+
+
+def extract_page_spans(page, page_num, page1_y_threshold=None):
+    """
+    Extract the text spans of a single page, skipping text within detected table regions.
+    Pages are independent of each other, so this only depends on its arguments.
+    
+    Args:
+        page: PyMuPDF page object
+        page_num: Page number (0-indexed)
+        page1_y_threshold: Y coordinate threshold for page 1. If provided, only extract text 
+                          from below this y coordinate on the first page (page 0)
+    
+    Returns:
+        Tuple of (spans outside tables, number of spans found, number of table spans skipped)
+    """
+    page_width = page.rect.width
+    page_height = page.rect.height
+    blocks = page.get_text("dict", flags=TEXT_EXTRACTION_FLAGS)["blocks"]
+    
+    # Debug info for page 1
+    if page_num == 0 and page1_y_threshold is not None:
+        log.debug("Page %d: Extracting text below y coordinate %s", page_num + 1, page1_y_threshold)
+    
+    # Single pass over the page: build the full span records, which also carry the
+    # bbox coordinates needed for table detection
+    page_text_spans = []
+    page_span_bounds = []
+    for block in blocks:
+        if block['type'] != 0:  # skip non-text blocks
+            continue
+        for line in block["lines"]:
+            for span in line["spans"]:
+                x0, y0, x1, y1 = span["bbox"]
+                text = span["text"]
+                
+                # Skip text that doesn't contain alphabets or numbers
+                if not is_meaningful_text(text):
+                    continue
+                
+                # Special handling for page 1 (page_num == 0): only extract text below y_threshold
+                if page_num == 0 and page1_y_threshold is not None:
+                    if y0 < page1_y_threshold:
+                        continue  # Skip text above the threshold on page 1
+                
+                # Determine if font is bold based on font name
+                bold = is_bold_font(span.get("font", ""))
+                
+                page_text_spans.append({
+                    "text": text,
+                    "bold": bold,
+                    "size": span.get("size", 0.0),
+                    "x0": x0,
+                    "x1": x1,
+                    "y0": y0,
+                    "y1": y1,
+                    # |midpoint - page centre| < 10, compared on the doubled values so no
+                    # halving is needed (scaling by 2 is exact, so the result is identical)
+                    "centered": abs(x0 + x1 - page_width) < 20,  # margin threshold
+                    "page": page_num + 1  # Add page number (1-indexed for display)
+                })
+                page_span_bounds.append((x0, y0, x1, y1))
+    
+    # Detect tables in this page
+    table_regions = detect_tables_in_page(page_text_spans, page_width, page_height, span_bounds=page_span_bounds)
+    page_spans_processed = len(page_text_spans)
+    
+    # Most pages have no tables: keep every span without running the overlap checks
+    if not table_regions:
+        return page_text_spans, page_spans_processed, 0
+    
+    log.debug("Page %d: Detected %d table regions", page_num + 1, len(table_regions))
+    for i, table in enumerate(table_regions):
+        log.debug("  Table %d: (%.1f, %.1f) to (%.1f, %.1f) with %d text spans",
+                  i + 1, table['x0'], table['y0'], table['x1'], table['y1'], table['span_count'])
+    
+    # Keep only the text spans that are NOT in tables
+    in_table_flags = find_spans_in_tables(page_span_bounds, table_regions)
+    page_spans = [span for span, in_table in zip(page_text_spans, in_table_flags) if not in_table]
+    page_spans_skipped = sum(in_table_flags)
+    
+    if page_spans_skipped > 0:
+        log.debug("Page %d: Processed %d spans, skipped %d table spans",
+                  page_num + 1, page_spans_processed, page_spans_skipped)
+    
+    return page_spans, page_spans_processed, page_spans_skipped
 
 
 def extract_fitz_data(pdf_path, start_page=1, page1_y_threshold=None):
@@ -218,165 +426,180 @@ def extract_fitz_data(pdf_path, start_page=1, page1_y_threshold=None):
     Skip text that is within detected table regions.
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or an already open fitz.Document (which is left open
+                  for the caller)
         start_page: Starting page number (0-indexed)
         page1_y_threshold: Y coordinate threshold for page 1. If provided, only extract text 
                           from below this y coordinate on the first page (page 0)
     """
-    doc = fitz.open(pdf_path)
+    owns_doc = not isinstance(pdf_path, fitz.Document)
+    doc = fitz.open(pdf_path) if owns_doc else pdf_path
     
     # Check if the document has enough pages
     if len(doc) < start_page + 1:
-        print(f"Warning: Document has only {len(doc)} pages, cannot access page {start_page + 1}")
-        doc.close()
+        log.warning("Document has only %d pages, cannot access page %d", len(doc), start_page + 1)
+        if owns_doc:
+            doc.close()
         return []
     
+    # Process from start_page to end of document. PyMuPDF documents must not be shared
+    # between threads, so pages are processed sequentially and each page reports its own counts.
+    results, total_text_spans, total_table_spans_skipped = extract_page_range_spans(
+        doc, range(start_page, len(doc)), page1_y_threshold
+    )
+    log_table_filtering_summary(total_text_spans, total_table_spans_skipped, len(results))
+    
+    if owns_doc:
+        doc.close()
+    return results
+
+
+def extract_page_range_spans(pdf_path, page_numbers, page1_y_threshold=None):
+    """
+    Extract the text spans of a range of pages, in page order.
+    
+    Args:
+        pdf_path: Path to the PDF file, or an already open fitz.Document
+        page_numbers: Page numbers to extract (0-indexed)
+        page1_y_threshold: Y coordinate threshold for page 1 (see extract_page_spans)
+    
+    Returns:
+        Tuple of (spans outside tables, number of spans found, number of table spans skipped)
+    """
+    owns_doc = not isinstance(pdf_path, fitz.Document)
+    doc = fitz.open(pdf_path) if owns_doc else pdf_path
+    
     results = []
     total_text_spans = 0
     total_table_spans_skipped = 0
     
-    # Process from start_page to end of document
-    for page_num in range(start_page, len(doc)):
-        page = doc[page_num]
-        page_width = page.rect.width
-        page_height = page.rect.height
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Debug info for page 1
-        if page_num == 0 and page1_y_threshold is not None:
-            print(f"Page {page_num + 1}: Extracting text below y coordinate {page1_y_threshold}")
-        
-        # First pass: collect all text spans for table detection
-        page_text_spans = []
-        for block in blocks:
-            if block['type'] != 0:  # skip non-text blocks
-                continue
-            for line in block["lines"]:
-                for span in line["spans"]:
-                    x0, y0, x1, y1 = span["bbox"]
-                    text = span["text"]
-                    
-                    # Skip text that doesn't contain alphabets or numbers
-                    if not is_meaningful_text(text):
-                        continue
-                    
-                    # Special handling for page 1 (page_num == 0): only extract text below y_threshold
-                    if page_num == 0 and page1_y_threshold is not None:
-                        if y0 < page1_y_threshold:
-                            continue  # Skip text above the threshold on page 1
-                    
-                    page_text_spans.append({
-                        'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1, 
-                        'text': text, 'span': span
-                    })
-        
-        # Detect tables in this page
-        table_regions = detect_tables_in_page(page_text_spans, page_width, page_height)
-        
-        if table_regions:
-            print(f"Page {page_num + 1}: Detected {len(table_regions)} table regions")
-            for i, table in enumerate(table_regions):
-                print(f"  Table {i+1}: ({table['x0']:.1f}, {table['y0']:.1f}) to ({table['x1']:.1f}, {table['y1']:.1f}) with {table['span_count']} text spans")
-        
-        # Second pass: extract text spans that are NOT in tables
-        page_spans_processed = 0
-        page_spans_skipped = 0
-        
-        for text_span_info in page_text_spans:
-            total_text_spans += 1
-            page_spans_processed += 1
-            
-            # Check if this text span is within a table
-            if is_text_in_table(text_span_info, table_regions):
-                total_table_spans_skipped += 1
-                page_spans_skipped += 1
-                continue  # Skip text that's inside a table
-            
-            # Extract information from the span
-            span = text_span_info['span']
-            x0, y0, x1, y1 = text_span_info['x0'], text_span_info['y0'], text_span_info['x1'], text_span_info['y1']
-            text = text_span_info['text']
-            
-            font = span.get("font", "")
-            size = span.get("size", 0.0)
-            centered = abs((x0 + x1)/2 - page_width/2) < 10  # margin threshold
-
-            # Determine if font is bold based on font name
-            bold = 'Bold' in font or 'bold' in font.lower()
-
-            results.append({
-                "text": text,
-                "bold": bold,
-                "size": size,
-                "x0": x0,
-                "x1": x1,
-                "y0": y0,
-                "y1": y1,
-                "centered": centered,
-                "page": page_num + 1  # Add page number (1-indexed for display)
-            })
-        
-        if page_spans_skipped > 0:
-            print(f"Page {page_num + 1}: Processed {page_spans_processed} spans, skipped {page_spans_skipped} table spans")
+    for page_num in page_numbers:
+        page_spans, page_spans_processed, page_spans_skipped = extract_page_spans(
+            doc[page_num], page_num, page1_y_threshold
+        )
+        results.extend(page_spans)
+        total_text_spans += page_spans_processed
+        total_table_spans_skipped += page_spans_skipped
+    
+    if owns_doc:
+        doc.close()
+    return results, total_text_spans, total_table_spans_skipped
+
+
+def extract_fitz_data_parallel(pdf_path, start_page=1, page1_y_threshold=None, num_workers=4):
+    """
+    Same as extract_fitz_data, but the pages are split into contiguous ranges that are
+    extracted in separate worker processes, each opening its own copy of the document.
+    Worth it for long documents only; process start-up dominates on short ones. Inside a
+    worker process (e.g. one PDF of a process_pdfs.py batch) the CPUs are already shared out
+    between documents, so the pages are extracted in-process instead.
+    
+    Args:
+        pdf_path: Path to the PDF file, or an already open (file-backed) fitz.Document
+        start_page: Starting page number (0-indexed)
+        page1_y_threshold: Y coordinate threshold for page 1. If provided, only extract text 
+                          from below this y coordinate on the first page (page 0)
+        num_workers: Maximum number of worker processes
+    """
+    source = pdf_path
+    if isinstance(pdf_path, fitz.Document):
+        page_count = len(pdf_path)
+        pdf_path = pdf_path.name
+    else:
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+    
+    # Check if the document has enough pages
+    if page_count < start_page + 1:
+        log.warning("Document has only %d pages, cannot access page %d", page_count, start_page + 1)
+        return []
     
-    print(f"\nTable filtering summary:")
-    print(f"  Total text spans found: {total_text_spans}")
-    print(f"  Text spans skipped (in tables): {total_table_spans_skipped}")
-    print(f"  Text spans extracted (outside tables): {len(results)}")
-    print(f"  Table filtering rate: {(total_table_spans_skipped/total_text_spans*100):.1f}%" if total_text_spans > 0 else "  Table filtering rate: 0.0%")
+    page_numbers = range(start_page, page_count)
+    if multiprocessing.parent_process() is not None:
+        num_workers = 1  # Already in a pool worker: don't oversubscribe the CPUs
+    num_workers = max(1, min(num_workers, os.cpu_count() or 1, len(page_numbers)))
+    chunk_size = -(-len(page_numbers) // num_workers)
+    page_chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+    
+    # Chunks come back in submission order, so the spans stay in page order. With a
+    # single chunk (e.g. on a single CPU) a worker process would only add overhead, and an
+    # already open document is reused.
+    if len(page_chunks) == 1:
+        chunk_results = [extract_page_range_spans(source, page_chunks[0], page1_y_threshold)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(page_chunks)) as executor:
+            chunk_results = list(executor.map(
+                extract_page_range_spans, repeat(pdf_path), page_chunks, repeat(page1_y_threshold)
+            ))
     
-    doc.close()
+    results = []
+    total_text_spans = 0
+    total_table_spans_skipped = 0
+    for chunk_spans, chunk_spans_processed, chunk_spans_skipped in chunk_results:
+        results.extend(chunk_spans)
+        total_text_spans += chunk_spans_processed
+        total_table_spans_skipped += chunk_spans_skipped
+    
+    log_table_filtering_summary(total_text_spans, total_table_spans_skipped, len(results))
     return results
 
 
+def log_table_filtering_summary(total_text_spans, total_table_spans_skipped, extracted_count):
+    """
+    Log how many of the extracted text spans were skipped as table content.
+    """
+    log.info("Table filtering summary: %d text spans found, %d skipped (in tables), "
+             "%d extracted (outside tables), filtering rate %.1f%%",
+             total_text_spans, total_table_spans_skipped, extracted_count,
+             total_table_spans_skipped / total_text_spans * 100 if total_text_spans > 0 else 0.0)
+
+
 def group_spans_by_line(data, y_threshold=2.0):
     """
     Group text spans that are on the same line (similar y0 and y1 values) within each page.
     """
-    # First group by page
-    pages = defaultdict(list)
-    for item in data:
-        pages[item['page']].append(item)
+    # Line key of every span: page plus y0/y1 rounded to the y_threshold grid
+    line_keys = [
+        (item['page'], round(item['y0'] / y_threshold), round(item['y1'] / y_threshold))
+        for item in data
+    ]
     
-    result = []
+    # One stable sort by (line key, x0) replaces the per-line buckets and sorts:
+    # spans of the same line become adjacent and ordered left to right
+    order = sorted(range(len(data)), key=lambda i: (line_keys[i], data[i]['x0']))
     
-    # Process each page separately
-    for page_num in sorted(pages.keys()):
-        page_data = pages[page_num]
-        grouped_lines = defaultdict(list)
-        
-        for item in page_data:
-            # Create a key based on rounded y0 and y1 values for this page
-            y0_key = round(item['y0'] / y_threshold) * y_threshold
-            y1_key = round(item['y1'] / y_threshold) * y_threshold
-            line_key = (y0_key, y1_key)
-            
-            grouped_lines[line_key].append(item)
+    lines = []
+    for line_key, line_indices in groupby(order, key=line_keys.__getitem__):
+        line_indices = list(line_indices)
+        first_span = data[line_indices[0]]
         
-        # Sort each line by x0 position and merge text within this page
-        for line_key, spans in grouped_lines.items():
-            spans.sort(key=lambda x: x['x0'])  # Sort left to right
-            
-            # Merge spans on the same line
-            merged_text = ' '.join(span['text'].strip() for span in spans if span['text'].strip())
-            
-            if merged_text:  # Only include non-empty lines
-                result.append({
-                    'text': merged_text,
-                    'y0': spans[0]['y0'],
-                    'y1': spans[0]['y1'],
-                    'x0': spans[0]['x0'],
-                    'x1': spans[-1]['x1'],
-                    'size': spans[0]['size'],
-                    'bold': any(span['bold'] for span in spans),
-                    'centered': spans[0]['centered'],
-                    'page': spans[0]['page'],
-                    'span_count': len(spans)
-                })
+        # Merge spans on the same line (most lines are a single span)
+        if len(line_indices) == 1:
+            merged_text = first_span['text'].strip()
+        else:
+            stripped_texts = [data[i]['text'].strip() for i in line_indices]
+            merged_text = ' '.join([text for text in stripped_texts if text])
+        
+        if merged_text:  # Only include non-empty lines
+            bold = first_span['bold'] or any(data[i]['bold'] for i in line_indices[1:])
+            line = {
+                'text': merged_text,
+                'y0': first_span['y0'],
+                'y1': first_span['y1'],
+                'x0': first_span['x0'],
+                'x1': data[line_indices[-1]]['x1'],
+                'size': first_span['size'],
+                'bold': bold,
+                'centered': first_span['centered'],
+                'page': first_span['page'],
+                'span_count': len(line_indices)
+            }
+            # Remember where the line first appears so ties keep document order
+            lines.append((first_span['page'], first_span['y0'], min(line_indices), line))
     
     # Sort by page first, then by y position (top to bottom)
-    result.sort(key=lambda x: (x['page'], x['y0']))
-    return result
+    lines.sort(key=lambda entry: entry[:3])
+    return [entry[3] for entry in lines]
 
 
 def remove_headers_footers(grouped_lines, header_threshold=100, footer_threshold=100):
@@ -396,91 +619,37 @@ def remove_headers_footers(grouped_lines, header_threshold=100, footer_threshold
     for line in grouped_lines:
         pages[line['page']].append(line)
     
-    # Get page dimensions (assuming all pages have similar dimensions)
-    first_page_lines = list(pages.values())[0]
-    if not first_page_lines:
+    # If only one page, no repetitive headers/footers to remove
+    if len(pages) <= 1:
         return grouped_lines
     
-    # Estimate page height from the range of y-coordinates
-    all_y_coords = [line['y0'] for line in grouped_lines]
-    page_height = max(all_y_coords) - min(all_y_coords) + 100  # Add some buffer
-    
-    # Identify potential header and footer lines for each page
-    potential_headers = defaultdict(list)  # page -> list of header lines
-    potential_footers = defaultdict(list)  # page -> list of footer lines
+    # Count on how many pages each text appears in the header area and in the footer area
+    header_page_counts = Counter()
+    footer_page_counts = Counter()
     
     for page_num, page_lines in pages.items():
-        page_lines.sort(key=lambda x: x['y0'])  # Sort by y position
-        
-        # Find page-specific min and max y coordinates
+        # Find page-specific min and max y coordinates; the y0 column is reused below
         page_y_coords = [line['y0'] for line in page_lines]
         page_min_y = min(page_y_coords)
         page_max_y = max(page_y_coords)
         
-        for line in page_lines:
+        page_header_texts = set()
+        page_footer_texts = set()
+        for line, line_y0 in zip(page_lines, page_y_coords):
             # Check if line is in header area (top of page)
-            if line['y0'] - page_min_y <= header_threshold:
-                potential_headers[page_num].append(line)
+            if line_y0 - page_min_y <= header_threshold:
+                page_header_texts.add(line['text'].strip())
             # Check if line is in footer area (bottom of page)
-            elif page_max_y - line['y0'] <= footer_threshold:
-                potential_footers[page_num].append(line)
-    
-    # Find lines that repeat across all pages
-    if len(pages) <= 1:
-        # If only one page, no repetitive headers/footers to remove
-        return grouped_lines
-    
-    # Check headers: find lines that appear in the same position across all pages
-    repetitive_header_texts = set()
-    if potential_headers:
-        # Get header lines from first page as reference
-        first_page_num = min(pages.keys())
-        reference_headers = potential_headers[first_page_num]
-        
-        for ref_line in reference_headers:
-            ref_text = ref_line['text'].strip()
-            if not ref_text:
-                continue
-            
-            # Check if this text appears in headers of ALL other pages
-            appears_in_all_pages = True
-            for page_num in pages.keys():
-                if page_num == first_page_num:
-                    continue
-                    
-                page_header_texts = [line['text'].strip() for line in potential_headers[page_num]]
-                if ref_text not in page_header_texts:
-                    appears_in_all_pages = False
-                    break
-            
-            if appears_in_all_pages:
-                repetitive_header_texts.add(ref_text)
-    
-    # Check footers: find lines that appear in the same position across all pages
-    repetitive_footer_texts = set()
-    if potential_footers:
-        # Get footer lines from first page as reference
-        first_page_num = min(pages.keys())
-        reference_footers = potential_footers[first_page_num]
+            elif page_max_y - line_y0 <= footer_threshold:
+                page_footer_texts.add(line['text'].strip())
         
-        for ref_line in reference_footers:
-            ref_text = ref_line['text'].strip()
-            if not ref_text:
-                continue
-            
-            # Check if this text appears in footers of ALL other pages
-            appears_in_all_pages = True
-            for page_num in pages.keys():
-                if page_num == first_page_num:
-                    continue
-                    
-                page_footer_texts = [line['text'].strip() for line in potential_footers[page_num]]
-                if ref_text not in page_footer_texts:
-                    appears_in_all_pages = False
-                    break
-            
-            if appears_in_all_pages:
-                repetitive_footer_texts.add(ref_text)
+        header_page_counts.update(page_header_texts)
+        footer_page_counts.update(page_footer_texts)
+    
+    # Texts found in the header (or footer) area of ALL pages are repetitive
+    page_count = len(pages)
+    repetitive_header_texts = {text for text, count in header_page_counts.items() if text and count == page_count}
+    repetitive_footer_texts = {text for text, count in footer_page_counts.items() if text and count == page_count}
     
     # Filter out repetitive headers and footers
     filtered_lines = []
@@ -496,11 +665,11 @@ def remove_headers_footers(grouped_lines, header_threshold=100, footer_threshold
         
         filtered_lines.append(line)
     
-    print(f"\nRemoved {removed_count} repetitive header/footer lines")
+    log.info("Removed %d repetitive header/footer lines", removed_count)
     if repetitive_header_texts:
-        print(f"Repetitive headers removed: {list(repetitive_header_texts)}")
+        log.debug("Repetitive headers removed: %s", list(repetitive_header_texts))
     if repetitive_footer_texts:
-        print(f"Repetitive footers removed: {list(repetitive_footer_texts)}")
+        log.debug("Repetitive footers removed: %s", list(repetitive_footer_texts))
     
     return filtered_lines
 
@@ -514,21 +683,24 @@ def remove_ordinal_suffixes(grouped_lines):
     filtered_lines = []
     removed_count = 0
     removed_texts = []
+    # Details of removed items are only collected when debug logging will show them
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     
     for line in grouped_lines:
-        line_text = line['text'].strip().lower()
+        line_text = line['text'].strip()
         
         # Check if the line contains only ordinal suffixes
-        if line_text in ordinal_suffixes:
+        if line_text.lower() in ordinal_suffixes:
             removed_count += 1
-            removed_texts.append(line['text'].strip())
+            if debug_enabled:
+                removed_texts.append(line_text)
             continue
         
         filtered_lines.append(line)
     
-    print(f"\nRemoved {removed_count} ordinal suffix lines")
+    log.info("Removed %d ordinal suffix lines", removed_count)
     if removed_texts:
-        print(f"Ordinal suffixes removed: {removed_texts}")
+        log.debug("Ordinal suffixes removed: %s", removed_texts)
     
     return filtered_lines
 
@@ -551,31 +723,29 @@ def filter_groups_by_starting_position(consecutive_groups, center_threshold_rati
     estimated_page_width = max(all_x1_coords)
     center_threshold = estimated_page_width * center_threshold_ratio
     
-    filtered_groups = []
-    removed_count = 0
-    removed_groups = []
+    # Removal mask over the starting x coordinates: groups that start from center or
+    # after center are removed
+    removed_mask = [group['x0'] >= center_threshold for group in consecutive_groups]
+    filtered_groups = [group for group, removed in zip(consecutive_groups, removed_mask) if not removed]
+    removed_count = len(consecutive_groups) - len(filtered_groups)
     
-    for group in consecutive_groups:
-        # Check the starting x coordinate of the group
-        starting_x = group['x0']
-        
-        # If the group starts from center or after center, remove it
-        if starting_x >= center_threshold:
-            removed_count += 1
-            removed_groups.append({
+    removed_groups = []
+    if removed_count and log.isEnabledFor(logging.DEBUG):
+        removed_groups = [
+            {
                 'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
-                'starting_x': starting_x,
+                'starting_x': group['x0'],
                 'center_threshold': center_threshold
-            })
-            continue
-        
-        filtered_groups.append(group)
+            }
+            for group, removed in zip(consecutive_groups, removed_mask) if removed
+        ]
     
-    print(f"\nRemoved {removed_count} groups that start from center or after center")
+    log.info("Removed %d groups that start from center or after center", removed_count)
     if removed_groups:
-        print("Groups removed (showing first 10):")
-        for i, removed in enumerate(removed_groups[:10]):
-            print(f"  - '{removed['text']}' (starts at x={removed['starting_x']:.1f}, threshold={removed['center_threshold']:.1f})")
+        log.debug("Groups removed (showing first 10):")
+        for removed in removed_groups[:10]:
+            log.debug("  - '%s' (starts at x=%.1f, threshold=%.1f)",
+                      removed['text'], removed['starting_x'], removed['center_threshold'])
     
     return filtered_groups
 
@@ -596,40 +766,34 @@ def filter_groups_by_line_count(consecutive_groups, max_lines=1, large_font_thre
     if not consecutive_groups:
         return consecutive_groups
     
-    filtered_groups = []
-    removed_count = 0
-    removed_groups = []
+    # Removal mask: groups with more lines than allowed are removed, except large font
+    # groups which are kept regardless of line count
+    removed_mask = [
+        group.get('line_count', 1) > max_lines and not group.get('size', 0) >= large_font_threshold
+        for group in consecutive_groups
+    ]
+    filtered_groups = [group for group, removed in zip(consecutive_groups, removed_mask) if not removed]
+    removed_count = len(consecutive_groups) - len(filtered_groups)
     
-    for group in consecutive_groups:
-        # Check the line count of the group
-        line_count = group.get('line_count', 1)
-        font_size = group.get('size', 0)
-        
-        # If the group has more lines than allowed, check if it should be removed
-        if line_count > max_lines:
-            # Exception: Keep large font groups regardless of line count
-            if font_size >= large_font_threshold:
-                filtered_groups.append(group)
-                continue
-            
-            # Remove multi-line groups with smaller fonts
-            removed_count += 1
-            removed_groups.append({
+    removed_groups = []
+    if removed_count and log.isEnabledFor(logging.DEBUG):
+        removed_groups = [
+            {
                 'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
-                'line_count': line_count,
+                'line_count': group.get('line_count', 1),
                 'max_lines': max_lines,
-                'font_size': font_size
-            })
-            continue
-        
-        filtered_groups.append(group)
+                'font_size': group.get('size', 0)
+            }
+            for group, removed in zip(consecutive_groups, removed_mask) if removed
+        ]
     
-    print(f"\nRemoved {removed_count} groups that have more than {max_lines} line(s)")
-    print(f"Exception: Groups with font size >= {large_font_threshold}pt are preserved regardless of line count")
+    log.info("Removed %d groups that have more than %d line(s)", removed_count, max_lines)
+    log.debug("Exception: Groups with font size >= %spt are preserved regardless of line count", large_font_threshold)
     if removed_groups:
-        print("Groups removed (showing first 10):")
-        for i, removed in enumerate(removed_groups[:10]):
-            print(f"  - '{removed['text']}' (lines: {removed['line_count']}, font: {removed['font_size']:.1f}pt, max allowed: {removed['max_lines']})")
+        log.debug("Groups removed (showing first 10):")
+        for removed in removed_groups[:10]:
+            log.debug("  - '%s' (lines: %d, font: %.1fpt, max allowed: %d)",
+                      removed['text'], removed['line_count'], removed['font_size'], removed['max_lines'])
     
     return filtered_groups
 
@@ -648,10 +812,12 @@ def filter_groups_by_copyright(consecutive_groups):
     filtered_groups = []
     removed_count = 0
     removed_groups = []
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     
     for group in consecutive_groups:
         group_text = group['text'].strip()
-        group_text_lower = group_text.lower()
+        # Groups from build_line_group carry their lower-cased text; others are lowered here
+        group_text_lower = (group.get('text_lower') or group['text'].lower()).strip()
         
         # Check if the group contains copyright symbols or text
         has_copyright = (
@@ -662,19 +828,20 @@ def filter_groups_by_copyright(consecutive_groups):
         
         if has_copyright:
             removed_count += 1
-            removed_groups.append({
-                'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
-                'page': group['page']
-            })
+            if debug_enabled:
+                removed_groups.append({
+                    'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
+                    'page': group['page']
+                })
             continue
         
         filtered_groups.append(group)
     
-    print(f"\nRemoved {removed_count} groups containing copyright symbols/text")
+    log.info("Removed %d groups containing copyright symbols/text", removed_count)
     if removed_groups:
-        print("Groups removed (showing first 10):")
-        for i, removed in enumerate(removed_groups[:10]):
-            print(f"  - '{removed['text']}' (Page: {removed['page']})")
+        log.debug("Groups removed (showing first 10):")
+        for removed in removed_groups[:10]:
+            log.debug("  - '%s' (Page: %d)", removed['text'], removed['page'])
     
     return filtered_groups
 
@@ -699,11 +866,13 @@ def filter_duplicate_headings_across_pages(consecutive_groups, position_toleranc
     
     # Only apply duplicate filtering if there are 2 or more pages
     if total_pages < 2:
-        print(f"\nSkipping duplicate filtering - only {total_pages} page(s) found")
+        log.info("Skipping duplicate filtering - only %d page(s) found", total_pages)
         return consecutive_groups
     
-    # Group by text content, font size, and approximate position
+    # Group by text content, font size, and approximate position, tracking the set of
+    # pages each key appears on in the same pass
     text_position_groups = defaultdict(list)
+    text_position_pages = defaultdict(set)
     
     for group in consecutive_groups:
         # Create a key based on text, font size, and rounded position
@@ -714,6 +883,7 @@ def filter_duplicate_headings_across_pages(consecutive_groups, position_toleranc
         
         composite_key = (text_key, size_key, x_key, y_key)
         text_position_groups[composite_key].append(group)
+        text_position_pages[composite_key].add(group['page'])
     
     # Calculate threshold: more than half of total pages
     page_threshold = total_pages * 0.5
@@ -721,37 +891,36 @@ def filter_duplicate_headings_across_pages(consecutive_groups, position_toleranc
     filtered_groups = []
     removed_count = 0
     removed_groups = []
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     
-    print(f"\nAnalyzing duplicate headings across {total_pages} pages (threshold: >{page_threshold:.1f} pages)")
+    log.debug("Analyzing duplicate headings across %d pages (threshold: >%.1f pages)", total_pages, page_threshold)
     
     for composite_key, groups in text_position_groups.items():
-        text_key, size_key, x_key, y_key = composite_key
-        
         # Count unique pages this text appears on
-        unique_pages = set(group['page'] for group in groups)
-        page_count = len(unique_pages)
+        page_count = len(text_position_pages[composite_key])
         
         # If this text appears on more than half the pages, mark as duplicate
         if page_count > page_threshold:
             # Remove all instances of this duplicate text
             for group in groups:
                 removed_count += 1
-                removed_groups.append({
-                    'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
-                    'page': group['page'],
-                    'size': group['size'],
-                    'x0': group['x0'],
-                    'y0': group['y0'],
-                    'page_count': page_count,
-                    'threshold': page_threshold
-                })
+                if debug_enabled:
+                    removed_groups.append({
+                        'text': group['text'][:50] + '...' if len(group['text']) > 50 else group['text'],
+                        'page': group['page'],
+                        'size': group['size'],
+                        'x0': group['x0'],
+                        'y0': group['y0'],
+                        'page_count': page_count,
+                        'threshold': page_threshold
+                    })
         else:
             # Keep all instances of this non-duplicate text
             filtered_groups.extend(groups)
     
-    print(f"Removed {removed_count} duplicate heading groups that appear on >{page_threshold:.1f} pages")
+    log.info("Removed %d duplicate heading groups that appear on >%.1f pages", removed_count, page_threshold)
     if removed_groups:
-        print("Duplicate headings removed (showing all):")
+        log.debug("Duplicate headings removed (showing all):")
         # Group removed items by text for cleaner display
         removed_by_text = defaultdict(list)
         for removed in removed_groups:
@@ -759,11 +928,78 @@ def filter_duplicate_headings_across_pages(consecutive_groups, position_toleranc
         
         for text, items in removed_by_text.items():
             pages = [str(item['page']) for item in items]
-            print(f"  - '{text}' (Size: {items[0]['size']:.1f}pt, X: {items[0]['x0']:.1f}, Pages: {', '.join(pages)}) - appears on {items[0]['page_count']} pages")
+            log.debug("  - '%s' (Size: %.1fpt, X: %.1f, Pages: %s) - appears on %d pages",
+                      text, items[0]['size'], items[0]['x0'], ', '.join(pages), items[0]['page_count'])
     
     return filtered_groups
 
 
+# Page number patterns - these will be searched within the text (contains). A pattern that
+# opens with an unbounded run is anchored to the start of that run with a lookbehind: a
+# match found inside a run also matches from its start, so this only stops the search from
+# rescanning the run from every position in it (quadratic on long digit/word runs).
+PAGE_NUMBER_PATTERNS = (
+    r'page\s+\d+',  # "Page 1", "Page 2", etc.
+    r'page\s+\d+\s+of\s+\d+',  # "Page 1 of 5", etc.
+    r'(?<!\d)\d+\s+of\s+\d+',  # "1 of 5", etc.
+    r'(?<!\d)\d+\s*/\s*\d+',  # "1/5", etc.
+)
+
+# Table of contents patterns - these must match exactly (full string)
+TOC_EXACT_PATTERNS = (
+    r'^\s*table\s+of\s+contents?\s*$',  # Exact match for "Table of Contents"
+    r'^\s*contents?\s*$',  # Exact match for "Contents"
+    r'^\s*toc\s*$',  # Exact match for "TOC"
+)
+
+# Date patterns - these will be searched within the text (contains); leading word runs are
+# anchored the same way as the page number patterns
+DATE_PATTERNS = (
+    r'(?<!\w)\w+\s+\d{1,2},?\s+\d{4}',  # "January 1, 2024", "Jan 1 2024"
+    r'(?<!\w)\w+\s+\d{4}',  # "January 2024", "Jan 2024"
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # "1/1/2024", "01-01-24"
+    r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',  # "2024-01-01", "2024/1/1"
+    r'\d{1,2}\s+\w+\s+\d{4}',  # "1 January 2024"
+)
+
+# Standalone date-related words - these must match exactly (full string)
+DATE_WORD_EXACT_PATTERNS = (
+    r'^\s*date\s*$',  # Exact match for "Date"
+    r'^\s*time\s*$',  # Exact match for "Time"
+    r'^\s*day\s*$',   # Exact match for "Day"
+    r'^\s*month\s*$', # Exact match for "Month"
+    r'^\s*year\s*$',  # Exact match for "Year"
+)
+
+# Individual patterns with their match types, in priority order: used to report which
+# pattern removed a group
+PAGE_DATE_SEARCH_PATTERNS = tuple(
+    [(re.compile(pattern, re.IGNORECASE), 'page_number') for pattern in PAGE_NUMBER_PATTERNS] +
+    [(re.compile(pattern, re.IGNORECASE), 'date') for pattern in DATE_PATTERNS]
+)
+TOC_DATE_MATCH_PATTERNS = tuple(
+    [(re.compile(pattern, re.IGNORECASE), 'table_of_contents') for pattern in TOC_EXACT_PATTERNS] +
+    [(re.compile(pattern, re.IGNORECASE), 'date_word') for pattern in DATE_WORD_EXACT_PATTERNS]
+)
+
+# Each pattern family fused into one alternation, so a group that matches nothing (the
+# common case) costs a single regex call per family
+PAGE_DATE_SEARCH_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in PAGE_NUMBER_PATTERNS + DATE_PATTERNS), re.IGNORECASE
+)
+TOC_DATE_MATCH_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in TOC_EXACT_PATTERNS + DATE_WORD_EXACT_PATTERNS), re.IGNORECASE
+)
+
+# Every text the exact patterns accept, lower-cased with whitespace runs collapsed. For
+# ASCII text this lookup is equivalent to TOC_DATE_MATCH_RE; non-ASCII text can still
+# match through case folding (e.g. 'ſ' for 's'), so it falls back to the regex.
+TOC_DATE_EXACT_TEXTS = frozenset({
+    'table of contents', 'table of content', 'contents', 'content', 'toc',
+    'date', 'time', 'day', 'month', 'year',
+})
+
+
 def filter_page_numbers_dates_toc(consecutive_groups):
     """
     Filter out groups that contain page numbers, table of contents references, or date-only text.
@@ -775,91 +1011,46 @@ def filter_page_numbers_dates_toc(consecutive_groups):
     if not consecutive_groups:
         return consecutive_groups
     
-    import re
-    
     filtered_groups = []
     removed_count = 0
     removed_groups = []
-    
-    # Define patterns for page numbers - these will be searched within the text (contains)
-    page_patterns = [
-        r'page\s+\d+',  # "Page 1", "Page 2", etc.
-        r'page\s+\d+\s+of\s+\d+',  # "Page 1 of 5", etc.
-        r'\d+\s+of\s+\d+',  # "1 of 5", etc.
-        r'\d+\s*/\s*\d+',  # "1/5", etc.
-    ]
-    
-    # Table of contents patterns - these must match exactly (full string)
-    toc_exact_patterns = [
-        r'^\s*table\s+of\s+contents?\s*$',  # Exact match for "Table of Contents"
-        r'^\s*contents?\s*$',  # Exact match for "Contents"
-        r'^\s*toc\s*$',  # Exact match for "TOC"
-    ]
-    
-    # Date patterns - these will be searched within the text (contains)
-    date_patterns = [
-        r'\w+\s+\d{1,2},?\s+\d{4}',  # "January 1, 2024", "Jan 1 2024"
-        r'\w+\s+\d{4}',  # "January 2024", "Jan 2024"
-        r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # "1/1/2024", "01-01-24"
-        r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',  # "2024-01-01", "2024/1/1"
-        r'\d{1,2}\s+\w+\s+\d{4}',  # "1 January 2024"
-    ]
-    
-    # Standalone date-related words - these must match exactly (full string)
-    date_word_exact_patterns = [
-        r'^\s*date\s*$',  # Exact match for "Date"
-        r'^\s*time\s*$',  # Exact match for "Time"  
-        r'^\s*day\s*$',   # Exact match for "Day"
-        r'^\s*month\s*$', # Exact match for "Month"
-        r'^\s*year\s*$',  # Exact match for "Year"
-    ]
-    
-    # Compile patterns with their match types
-    search_patterns = []  # Patterns to search within text (contains)
-    match_patterns = []   # Patterns to match exactly (full string)
-    
-    search_patterns.extend([(re.compile(pattern, re.IGNORECASE), 'page_number') for pattern in page_patterns])
-    search_patterns.extend([(re.compile(pattern, re.IGNORECASE), 'date') for pattern in date_patterns])
-    match_patterns.extend([(re.compile(pattern, re.IGNORECASE), 'table_of_contents') for pattern in toc_exact_patterns])
-    match_patterns.extend([(re.compile(pattern, re.IGNORECASE), 'date_word') for pattern in date_word_exact_patterns])
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     
     for group in consecutive_groups:
         group_text = group['text'].strip()
-        should_remove = False
-        removal_reason = None
-        matched_pattern = None
         
-        # Check search patterns (contains matching)
-        for compiled_pattern, pattern_type in search_patterns:
-            if compiled_pattern.search(group_text):
-                should_remove = True
-                removal_reason = pattern_type
-                matched_pattern = compiled_pattern.pattern
-                break
-        
-        # Check match patterns (exact matching) only if not already marked for removal
-        if not should_remove:
-            for compiled_pattern, pattern_type in match_patterns:
-                if compiled_pattern.match(group_text):
-                    should_remove = True
-                    removal_reason = pattern_type
-                    matched_pattern = compiled_pattern.pattern
-                    break
+        # Check search patterns (contains matching), then match patterns (exact matching)
+        # only if not already marked for removal
+        if PAGE_DATE_SEARCH_RE.search(group_text):
+            removal_patterns = PAGE_DATE_SEARCH_PATTERNS
+            is_search_match = True
+        elif (' '.join((group.get('text_lower') or group['text'].lower()).split()) in TOC_DATE_EXACT_TEXTS or
+                (not group_text.isascii() and TOC_DATE_MATCH_RE.match(group_text))):
+            removal_patterns = TOC_DATE_MATCH_PATTERNS
+            is_search_match = False
+        else:
+            filtered_groups.append(group)
+            continue
         
-        if should_remove:
-            removed_count += 1
+        removed_count += 1
+        if debug_enabled:
+            # The fused patterns only tell that some pattern matched; try the individual
+            # ones in order to report the first that did
+            removal_reason, matched_pattern = next(
+                (pattern_type, compiled_pattern.pattern)
+                for compiled_pattern, pattern_type in removal_patterns
+                if (compiled_pattern.search(group_text) if is_search_match else compiled_pattern.match(group_text))
+            )
             removed_groups.append({
                 'text': group['text'][:100] + '...' if len(group['text']) > 100 else group['text'],
                 'page': group['page'],
                 'reason': removal_reason,
                 'matched_pattern': matched_pattern
             })
-        else:
-            filtered_groups.append(group)
     
-    print(f"\nRemoved {removed_count} groups containing page numbers, dates, or TOC references")
+    log.info("Removed %d groups containing page numbers, dates, or TOC references", removed_count)
     if removed_groups:
-        print("Groups removed (showing all):")
+        log.debug("Groups removed (showing all):")
         # Group by removal reason for cleaner display
         by_reason = {}
         for removed in removed_groups:
@@ -869,9 +1060,9 @@ def filter_page_numbers_dates_toc(consecutive_groups):
             by_reason[reason].append(removed)
         
         for reason, items in by_reason.items():
-            print(f"  {reason.upper()}:")
+            log.debug("  %s:", reason.upper())
             for item in items:
-                print(f"    - '{item['text']}' (Page: {item['page']}) [Pattern: {item['matched_pattern']}]")
+                log.debug("    - '%s' (Page: %d) [Pattern: %s]", item['text'], item['page'], item['matched_pattern'])
     
     return filtered_groups
 
@@ -898,34 +1089,30 @@ def filter_groups_by_page_position(consecutive_groups, footer_threshold=100, pag
     # Use provided page height or default to standard letter size
     if page_height:
         page_bottom = page_height
-        print(f"Using provided page height: {page_bottom:.1f} points")
+        log.debug("Using provided page height: %.1f points", page_bottom)
     else:
         page_bottom = 792  # Default to standard letter size (8.5x11 inches = 612x792 points)
-        print(f"No page height provided, using default: {page_bottom:.1f} points")
+        log.debug("No page height provided, using default: %.1f points", page_bottom)
     
     footer_region_start = page_bottom - footer_threshold  # Fixed threshold from actual page bottom
     
-    # Group by page
-    pages = defaultdict(list)
-    for group in consecutive_groups:
-        pages[group['page']].append(group)
-    
     filtered_groups = []
     removed_count = 0
     removed_groups = []
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     
-    for page_num, page_groups in pages.items():
-        if not page_groups:
-            continue
-        
-        # Sort groups by y position (top to bottom) to find the last one
-        page_groups.sort(key=lambda x: x['y0'])
+    # Sort once by page and y position (top to bottom), then walk each page's run to find
+    # its last group. Groups are kept in this order, so the result needs no re-sort.
+    sorted_groups = sorted(consecutive_groups, key=itemgetter('page', 'y0'))
+    
+    for page_num, page_run in groupby(sorted_groups, key=itemgetter('page')):
+        page_groups = list(page_run)
         
         # Remove only the last group on this page if it doesn't meet special criteria
         if len(page_groups) > 1:
-            # Keep all groups except potentially the last one
-            for group in page_groups[:-1]:
-                filtered_groups.append(group)
+            # Keep all groups except potentially the last one; the run is already in
+            # y order, so the last group is simply the final element
+            filtered_groups.extend(page_groups[:-1])
             
             # Check if the last group meets any special criteria
             last_group = page_groups[-1]
@@ -943,129 +1130,187 @@ def filter_groups_by_page_position(consecutive_groups, footer_threshold=100, pag
             else:
                 # Remove the last group if it doesn't meet special criteria and is in footer region
                 removed_count += 1
-                removed_groups.append({
-                    'text': last_group['text'][:50] + '...' if len(last_group['text']) > 50 else last_group['text'],
-                    'page': last_group['page'],
-                    'y_position': last_group['y0'],
-                    'footer_region_start': footer_region_start,
-                    'page_bottom': page_bottom
-                })
+                if debug_enabled:
+                    removed_groups.append({
+                        'text': last_group['text'][:50] + '...' if len(last_group['text']) > 50 else last_group['text'],
+                        'page': last_group['page'],
+                        'y_position': last_group['y0'],
+                        'footer_region_start': footer_region_start,
+                        'page_bottom': page_bottom
+                    })
         else:
             # If there's only one group on the page, keep it (don't remove the only content)
             filtered_groups.extend(page_groups)
     
-    # Sort back by page and y position
-    filtered_groups.sort(key=lambda x: (x['page'], x['y0']))
-    
-    print(f"\nRemoved {removed_count} groups that are the last group on their page and in footer region")
-    print(f"Footer threshold: {footer_threshold} points from bottom of page (Page bottom: {page_bottom:.1f})")
-    print(f"Footer region starts at Y-coordinate: {footer_region_start:.1f}")
+    log.info("Removed %d groups that are the last group on their page and in footer region", removed_count)
+    log.debug("Footer threshold: %s points from bottom of page (Page bottom: %.1f)", footer_threshold, page_bottom)
+    log.debug("Footer region starts at Y-coordinate: %.1f", footer_region_start)
     if removed_groups:
-        print("Groups removed (showing first 10):")
-        for i, removed in enumerate(removed_groups[:10]):
-            print(f"  - '{removed['text']}' (Page: {removed['page']}, Y: {removed['y_position']:.1f})")
+        log.debug("Groups removed (showing first 10):")
+        for removed in removed_groups[:10]:
+            log.debug("  - '%s' (Page: %d, Y: %.1f)", removed['text'], removed['page'], removed['y_position'])
     
     return filtered_groups
 
 
+def build_line_group(group_lines, size, page_num, reason):
+    """
+    Combine a run of consecutive lines into a single group dictionary. The lower-cased
+    text is stored alongside the text so the group filters don't each recompute it.
+    
+    Args:
+        group_lines: Non-empty list of line dictionaries, in top-to-bottom order
+        size: Rounded font size shared by the group
+        page_num: Page the lines are on
+        reason: Why the group ended (e.g. 'size_change', 'end_of_page')
+    """
+    text = ' '.join(line['text'] for line in group_lines)
+    return {
+        'text': text,
+        'text_lower': text.lower(),
+        'size': size,
+        'page': page_num,
+        'bold': any(line['bold'] for line in group_lines),
+        'centered': any(line['centered'] for line in group_lines),
+        'y0': group_lines[0]['y0'],
+        'y1': group_lines[-1]['y1'],
+        'x0': min(line['x0'] for line in group_lines),
+        'x1': max(line['x1'] for line in group_lines),
+        'line_count': len(group_lines),
+        'reason': reason
+    }
+
+
 def group_consecutive_lines_by_size(grouped_lines, size_threshold=0.1, paragraph_gap_threshold=20):
     """
     Group consecutive lines that have the same font size within each page,
     but also consider paragraph breaks based on vertical spacing.
     """
-    # First group by page
-    pages = defaultdict(list)
-    for line in grouped_lines:
-        pages[line['page']].append(line)
-    
     result = []
     
-    # Process each page separately
-    for page_num in sorted(pages.keys()):
-        page_lines = pages[page_num]
-        # Sort by y position to ensure correct order
-        page_lines.sort(key=lambda x: x['y0'])
+    # Sort once by page and y position, then process each page's run separately
+    sorted_lines = sorted(grouped_lines, key=itemgetter('page', 'y0'))
+    
+    for page_num, page_run in groupby(sorted_lines, key=itemgetter('page')):
+        page_lines = list(page_run)
         
-        if not page_lines:
-            continue
+        # Per-line values needed by the grouping decisions, computed once per line up front
+        # instead of being re-derived from the dicts while scanning
+        line_sizes = [round(line['size'], 1) for line in page_lines]
+        line_ends_with_colon = [line['text'].strip().endswith(':') for line in page_lines]
         
-        # Group consecutive lines with same size, considering paragraph breaks
-        current_group = [page_lines[0]]
-        current_size = round(page_lines[0]['size'], 1)
+        # Paragraph gaps only depend on adjacent lines, not on the grouping, so they are
+        # evaluated for every adjacent pair in one go: small_gaps[i-1] is for lines i-1 and i
+        line_y0s = [line['y0'] for line in page_lines]
+        small_gaps = [
+            abs(y0 - prev_y0) <= paragraph_gap_threshold
+            for prev_y0, y0 in zip(line_y0s, line_y0s[1:])
+        ]
+        
+        # Group consecutive lines with same size, considering paragraph breaks. Groups are
+        # contiguous runs of page_lines, tracked by the index where the current one starts.
+        group_start = 0
+        current_size = line_sizes[0]
         
         for i in range(1, len(page_lines)):
-            line = page_lines[i]
-            line_size = round(line['size'], 1)
-            
-            # Calculate vertical distance between current line and previous line
-            prev_line = page_lines[i-1]
-            vertical_gap = abs(line['y0'] - prev_line['y0'])
-            
             # Check conditions for grouping:
-            # 1. Same font size (within threshold)
-            # 2. Small vertical gap (within paragraph threshold)
+            # 1. Same font size (within threshold) as the first line of the group
+            # 2. Small vertical gap (within paragraph threshold) to the previous line
             # 3. Previous line doesn't end with colon (lines ending with ':' should be in their own group)
-            same_size = abs(line_size - current_size) <= size_threshold
-            small_gap = vertical_gap <= paragraph_gap_threshold
-            prev_line_ends_with_colon = current_group and current_group[-1]['text'].strip().endswith(':')
+            same_size = abs(line_sizes[i] - current_size) <= size_threshold
+            small_gap = small_gaps[i-1]
+            prev_line_ends_with_colon = line_ends_with_colon[i-1]
             
             if same_size and small_gap and not prev_line_ends_with_colon:
                 # Same group: same size AND small y difference AND previous line doesn't end with colon
-                current_group.append(line)
+                continue
+            
+            # Different group: different size OR large y difference OR previous line ends with colon
+            if prev_line_ends_with_colon:
+                reason = 'colon_separation'
+            elif not same_size:
+                reason = 'size_change'
             else:
-                # Different group: different size OR large y difference OR previous line ends with colon
-                if prev_line_ends_with_colon:
-                    reason = 'colon_separation'
-                elif not same_size:
-                    reason = 'size_change'
-                else:
-                    reason = 'paragraph_break'
-                
-                if current_group:
-                    # Combine texts from current group
-                    combined_text = ' '.join(line['text'] for line in current_group)
-                    result.append({
-                        'text': combined_text,
-                        'size': current_size,
-                        'page': page_num,
-                        'bold': any(line['bold'] for line in current_group),
-                        'centered': any(line['centered'] for line in current_group),
-                        'y0': current_group[0]['y0'],
-                        'y1': current_group[-1]['y1'],
-                        'x0': min(line['x0'] for line in current_group),
-                        'x1': max(line['x1'] for line in current_group),
-                        'line_count': len(current_group),
-                        'original_lines': [line['text'] for line in current_group],
-                        'reason': reason
-                    })
-                
-                # Start new group with current line
-                current_group = [line]
-                current_size = line_size
+                reason = 'paragraph_break'
+            
+            result.append(build_line_group(page_lines[group_start:i], current_size, page_num, reason))
+            
+            # Start new group with current line
+            group_start = i
+            current_size = line_sizes[i]
         
         # Don't forget the last group
-        if current_group:
-            combined_text = ' '.join(line['text'] for line in current_group)
-            result.append({
-                'text': combined_text,
-                'size': current_size,
-                'page': page_num,
-                'bold': any(line['bold'] for line in current_group),
-                'centered': any(line['centered'] for line in current_group),
-                'y0': current_group[0]['y0'],
-                'y1': current_group[-1]['y1'],
-                'x0': min(line['x0'] for line in current_group),
-                'x1': max(line['x1'] for line in current_group),
-                'line_count': len(current_group),
-                'original_lines': [line['text'] for line in current_group],
-                'reason': 'end_of_page'
-            })
+        result.append(build_line_group(page_lines[group_start:], current_size, page_num, 'end_of_page'))
     
     # Sort by page first, then by y position
     result.sort(key=lambda x: (x['page'], x['y0']))
     return result
 
 
+# Numbered heading prefix like "1", "1.", "1)", "2.1", "3.4.2" followed by whitespace
+NUMBER_HEADING_RE = re.compile(r'^\d+(\.\d*)*[.\)]?\s+')
+NUMBER_TRAILING_PUNCT_RE = re.compile(r'[.\)]+$')
+
+
+def parse_number_heading(text):
+    """Parse a numbered heading and return its components"""
+    text = text.strip()
+    # Match patterns like "1", "1.", "1)", "2.1", "3.4.2", etc.
+    match = NUMBER_HEADING_RE.match(text)
+    if not match:
+        return None
+    
+    # Extract the number part (remove trailing punctuation and space)
+    number_part = match.group().strip()
+    # Remove trailing punctuation
+    number_part = NUMBER_TRAILING_PUNCT_RE.sub('', number_part)
+    
+    # Split into components
+    parts = number_part.split('.')
+    return [int(p) for p in parts if p.isdigit()]
+
+
+def is_valid_continuation(current_numbers, next_numbers):
+    """Check if next_numbers is a valid continuation of current_numbers"""
+    if not current_numbers or not next_numbers:
+        return False
+    
+    # Case 1: Same prefix + next number (3.1 → 3.2, 3.1.1)
+    if len(current_numbers) == len(next_numbers):
+        # Same level: check if only last number incremented
+        if current_numbers[:-1] == next_numbers[:-1] and next_numbers[-1] > current_numbers[-1]:
+            return True
+    elif len(next_numbers) == len(current_numbers) + 1:
+        # Sublevel: 3.1 → 3.1.1
+        if current_numbers == next_numbers[:-1]:
+            return True
+    
+    # Case 2: Next integer (3.1 → 4)  
+    if len(next_numbers) == 1 and len(current_numbers) >= 1:
+        if next_numbers[0] == current_numbers[0] + 1:
+            return True
+    
+    return False
+
+
+def find_next_continuation(parsed_numbers, numbered_positions, start_idx, current_numbers):
+    """
+    Find the next valid continuation after start_idx.
+    
+    Args:
+        parsed_numbers: parse_number_heading result for every group
+        numbered_positions: Sorted indices of the groups that have a number heading; only
+                            these can be continuations, so the rest are never visited
+        start_idx: Index of the current decimal-numbered group
+        current_numbers: Parsed number components of the current group
+    """
+    for position in range(bisect_right(numbered_positions, start_idx), len(numbered_positions)):
+        i = numbered_positions[position]
+        if is_valid_continuation(current_numbers, parsed_numbers[i]):
+            return i
+    return None
+
+
 def filter_interrupting_non_numbered_headings(consecutive_groups):
     """
     Remove non-numbered headings that appear between decimal-numbered headings and their valid continuations.
@@ -1087,83 +1332,43 @@ def filter_interrupting_non_numbered_headings(consecutive_groups):
     if not consecutive_groups:
         return consecutive_groups
     
-    import re
-    
-    def parse_number_heading(text):
-        """Parse a numbered heading and return its components"""
-        text = text.strip()
-        # Match patterns like "1", "1.", "1)", "2.1", "3.4.2", etc.
-        number_pattern = r'^\d+(\.\d*)*[.\)]?\s+'
-        match = re.match(number_pattern, text)
-        if not match:
-            return None
-        
-        # Extract the number part (remove trailing punctuation and space)
-        number_part = match.group().strip()
-        # Remove trailing punctuation
-        number_part = re.sub(r'[.\)]+$', '', number_part)
-        
-        # Split into components
-        parts = number_part.split('.')
-        return [int(p) for p in parts if p.isdigit()]
-    
-    def is_valid_continuation(current_numbers, next_numbers):
-        """Check if next_numbers is a valid continuation of current_numbers"""
-        if not current_numbers or not next_numbers:
-            return False
-        
-        # Case 1: Same prefix + next number (3.1 → 3.2, 3.1.1)
-        if len(current_numbers) == len(next_numbers):
-            # Same level: check if only last number incremented
-            if current_numbers[:-1] == next_numbers[:-1] and next_numbers[-1] > current_numbers[-1]:
-                return True
-        elif len(next_numbers) == len(current_numbers) + 1:
-            # Sublevel: 3.1 → 3.1.1
-            if current_numbers == next_numbers[:-1]:
-                return True
-        
-        # Case 2: Next integer (3.1 → 4)  
-        if len(next_numbers) == 1 and len(current_numbers) >= 1:
-            if next_numbers[0] == current_numbers[0] + 1:
-                return True
-        
-        return False
-    
-    def find_next_continuation(groups, start_idx, current_numbers):
-        """Find the next valid continuation after start_idx"""
-        for i in range(start_idx + 1, len(groups)):
-            next_numbers = parse_number_heading(groups[i]['text'])
-            if next_numbers and is_valid_continuation(current_numbers, next_numbers):
-                return i
-        return None
-    
     filtered_groups = []
     removed_count = 0
     removed_groups = []
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+    
+    # Parse every group's number heading once, and index the numbered ones
+    parsed_numbers = [parse_number_heading(group['text']) for group in consecutive_groups]
+    numbered_positions = [i for i, numbers in enumerate(parsed_numbers) if numbers]
     
     i = 0
     while i < len(consecutive_groups):
         current_group = consecutive_groups[i]
-        current_numbers = parse_number_heading(current_group['text'])
+        current_numbers = parsed_numbers[i]
         
         # Always keep the current group initially
         filtered_groups.append(current_group)
         
         # If current group is a decimal-numbered heading, look for continuation
         if current_numbers and len(current_numbers) > 1:  # Decimal heading (e.g., 3.1, 2.3.4)
-            continuation_idx = find_next_continuation(consecutive_groups, i, current_numbers)
+            continuation_idx = find_next_continuation(parsed_numbers, numbered_positions, i, current_numbers)
             
             if continuation_idx is not None:
-                # Found valid continuation - remove all non-numbered groups in between
+                # Found valid continuation - remove all non-numbered groups in between. The
+                # reason is the same for all of them, so it is formatted once.
+                current_label = '.'.join(map(str, current_numbers))
+                continuation_label = '.'.join(map(str, parsed_numbers[continuation_idx]))
+                removal_reason = f'interrupting_between_{current_label}_and_{continuation_label}'
                 for j in range(i + 1, continuation_idx):
-                    intervening_numbers = parse_number_heading(consecutive_groups[j]['text'])
+                    intervening_numbers = parsed_numbers[j]
                     if not intervening_numbers:  # Non-numbered group
                         removed_count += 1
-                        removed_groups.append({
-                            'text': consecutive_groups[j]['text'][:100] + '...' if len(consecutive_groups[j]['text']) > 100 else consecutive_groups[j]['text'],
-                            'page': consecutive_groups[j]['page'],
-                            'reason': f'interrupting_between_{".".join(map(str, current_numbers))}_and_{".".join(map(str, parse_number_heading(consecutive_groups[continuation_idx]["text"])))}'
-                        })
+                        if debug_enabled:
+                            removed_groups.append({
+                                'text': consecutive_groups[j]['text'][:100] + '...' if len(consecutive_groups[j]['text']) > 100 else consecutive_groups[j]['text'],
+                                'page': consecutive_groups[j]['page'],
+                                'reason': removal_reason
+                            })
                     else:
                         # Keep numbered groups even if they're in between
                         filtered_groups.append(consecutive_groups[j])
@@ -1174,15 +1379,123 @@ def filter_interrupting_non_numbered_headings(consecutive_groups):
         
         i += 1
     
-    print(f"\nRemoved {removed_count} non-numbered headings that interrupt decimal-numbered sequences")
+    log.info("Removed %d non-numbered headings that interrupt decimal-numbered sequences", removed_count)
     if removed_groups:
-        print("Interrupting non-numbered headings removed:")
+        log.debug("Interrupting non-numbered headings removed:")
         for removed in removed_groups:
-            print(f"  - '{removed['text']}' (Page: {removed['page']}) [{removed['reason']}]")
+            log.debug("  - '%s' (Page: %d) [%s]", removed['text'], removed['page'], removed['reason'])
     
     return filtered_groups
 
 
+ASCII_DIGITS = frozenset('0123456789')
+
+# Common roman numerals (I, II, III, IV, ...), matched against upper-cased text
+ROMAN_NUMERAL_RE = re.compile(r'\b(?=[MDCLXVI])M{0,4}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})\b')
+
+# Patterns used by has_invalid_fullstop_between: decimal numbers (1., 1.1, 2.3.4) and
+# capitalised abbreviations (St., Dr.) at the end of the text or followed by whitespace
+DECIMAL_NUMBER_RE = re.compile(r'\b\d+(\.\d*)*\.?')
+END_ABBREVIATION_RE = re.compile(r'\b[A-Z][a-z]*\.\s*$')
+MID_ABBREVIATION_RE = re.compile(r'\b[A-Z][a-z]*\.\s+')
+
+
+# List of transitional/connector words that are unlikely to appear in headings (matched as
+# plain substrings of the lower-cased text)
+TRANSITIONAL_WORDS = (
+    'specifically,', 'however,', 'furthermore,', 'additionally,', 'therefore,',
+    'moreover,', 'consequently,', 'nevertheless,', 'nonetheless,', 'meanwhile,',
+    'subsequently,', 'similarly,', 'conversely,', 'alternatively,', 'accordingly,',
+    'hence,', 'thus,', 'indeed,', 'likewise,', 'otherwise,', 'namely,',
+    'for example,', 'for instance,', 'in particular,', 'in addition,', 'in contrast,',
+    'on the other hand,', 'as a result,', 'in conclusion,', 'in summary,',
+    'specifically ', 'however ', 'furthermore ', 'additionally ', 'therefore ',
+    'moreover ', 'consequently ', 'nevertheless ', 'nonetheless ', 'meanwhile ',
+    'subsequently ', 'similarly ', 'conversely ', 'alternatively ', 'accordingly ',
+    'hence ', 'thus ', 'indeed ', 'likewise ', 'otherwise ', 'namely '
+)
+
+# All transitional words in one alternation, so a group is scanned once instead of once per word
+TRANSITIONAL_WORDS_RE = re.compile('|'.join(re.escape(word) for word in TRANSITIONAL_WORDS))
+
+
+def contains_digit(text):
+    """Check if text contains a digit (any character for which str.isdigit() is true)"""
+    # frozenset.isdisjoint scans the string in C; only non-ASCII text can hold other digits
+    # (e.g. superscripts), which need the per-character check
+    return not ASCII_DIGITS.isdisjoint(text) or (not text.isascii() and any(char.isdigit() for char in text))
+
+
+def contains_roman_numeral(text):
+    """Check if text contains roman numerals (I, II, III, IV, V, VI, VII, VIII, IX, X, etc.)"""
+    # Pattern is upper-case only, so the text is upper-cased (case insensitive match)
+    return bool(ROMAN_NUMERAL_RE.search(text.upper()))
+
+
+def starts_with_lowercase(text):
+    """Check if text starts with a lowercase letter"""
+    return text and text[0].islower()
+
+
+def ends_with_fullstop(text):
+    """Check if text ends with a full stop"""
+    return text.strip().endswith('.')
+
+
+def has_invalid_fullstop_between(text):
+    """
+    Check if text contains full stops in between that are not part of numbers.
+    Valid: 1., 1.1, 2.3.4, St. (at end), Dr. (at end)
+    Invalid: St., Suite (full stop followed by comma), M5C 1M3. Proposals (full stop in middle)
+    """
+    # The substitutions below only remove text, so without any full stop there is nothing to find
+    if '.' not in text:
+        return False
+    
+    # Remove valid number patterns first (like 1., 1.1, 2.3.4, etc.)
+    # Pattern for decimal numbers: one or more digits, followed by dot, followed by optional digits
+    text_without_numbers = DECIMAL_NUMBER_RE.sub('', text)
+    
+    # Also remove common abbreviations at the end (like St., Dr., etc.)
+    # But only if they're at the very end or followed by whitespace
+    text_without_end_abbrev = END_ABBREVIATION_RE.sub('', text_without_numbers)
+    text_without_abbrev = MID_ABBREVIATION_RE.sub('', text_without_end_abbrev)
+    
+    # Now check if there are any remaining full stops
+    # If there are, they're likely invalid (in the middle of text)
+    return '.' in text_without_abbrev.strip()
+
+
+def contains_transitional_words(text, text_lower=None):
+    """
+    Check if text contains transitional or connector words that typically appear in body text, not headings.
+    Examples: specifically, however, furthermore, additionally, therefore, etc.
+    
+    Args:
+        text: Text to check
+        text_lower: Optional text.lower(), when the caller already has it
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Check if any transitional words appear in the text
+    return TRANSITIONAL_WORDS_RE.search(text_lower) is not None
+
+
+def contains_following_with_colon(text, text_lower=None):
+    """
+    Check if text contains both "following" and ":" which typically indicates 
+    introductory text rather than a heading.
+    
+    Args:
+        text: Text to check
+        text_lower: Optional text.lower(), when the caller already has it
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    return 'following' in text_lower and ':' in text
+
+
 def apply_heading_filters(filtered_groups):
     """
     Apply custom filtering criteria to identify headings from the final filtered groups.
@@ -1205,12 +1518,11 @@ def apply_heading_filters(filtered_groups):
     heading_groups = []
     
     # Get unique font sizes and find the top 2 biggest
-    font_sizes = list(set(group['size'] for group in filtered_groups))
-    font_sizes.sort(reverse=True)  # Sort in descending order
-    top_2_sizes = font_sizes[:2] if len(font_sizes) >= 2 else font_sizes
+    font_sizes = sorted({group['size'] for group in filtered_groups}, reverse=True)  # Descending order
+    top_2_sizes = font_sizes[:2]
     
-    print(f"\nApplying heading filters:")
-    print(f"Top 2 biggest font sizes: {top_2_sizes}")
+    log.debug("Applying heading filters - top 2 biggest font sizes: %s", top_2_sizes)
+    top_2_size_set = frozenset(top_2_sizes)
     
     criteria_matches = {
         'top_2_sizes': 0,
@@ -1224,118 +1536,38 @@ def apply_heading_filters(filtered_groups):
         'excluded_transitional_words': 0
     }
     
-    # Helper function to check for roman numerals
-    def contains_roman_numeral(text):
-        """Check if text contains roman numerals (I, II, III, IV, V, VI, VII, VIII, IX, X, etc.)"""
-        import re
-        # Pattern for common roman numerals (case insensitive)
-        roman_pattern = r'\b(?=[MDCLXVI])M{0,4}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})\b'
-        return bool(re.search(roman_pattern, text.upper()))
-    
-    # Helper function to check if text starts with lowercase
-    def starts_with_lowercase(text):
-        """Check if text starts with a lowercase letter"""
-        return text and text[0].islower()
-    
-    # Helper function to check if text ends with full stop
-    def ends_with_fullstop(text):
-        """Check if text ends with a full stop"""
-        return text.strip().endswith('.')
-    
-    # Helper function to check for invalid full stops in between
-    def has_invalid_fullstop_between(text):
-        """
-        Check if text contains full stops in between that are not part of numbers.
-        Valid: 1., 1.1, 2.3.4, St. (at end), Dr. (at end)
-        Invalid: St., Suite (full stop followed by comma), M5C 1M3. Proposals (full stop in middle)
-        """
-        import re
-        
-        # Remove valid number patterns first (like 1., 1.1, 2.3.4, etc.)
-        # Pattern for decimal numbers: one or more digits, followed by dot, followed by optional digits
-        text_without_numbers = re.sub(r'\b\d+(\.\d*)*\.?', '', text)
-        
-        # Also remove common abbreviations at the end (like St., Dr., etc.)
-        # But only if they're at the very end or followed by whitespace
-        text_without_end_abbrev = re.sub(r'\b[A-Z][a-z]*\.\s*$', '', text_without_numbers)
-        text_without_abbrev = re.sub(r'\b[A-Z][a-z]*\.\s+', '', text_without_end_abbrev)
-        
-        # Now check if there are any remaining full stops
-        # If there are, they're likely invalid (in the middle of text)
-        return '.' in text_without_abbrev.strip()
-    
-    # Helper function to check for transitional/connector words
-    def contains_transitional_words(text):
-        """
-        Check if text contains transitional or connector words that typically appear in body text, not headings.
-        Examples: specifically, however, furthermore, additionally, therefore, etc.
-        """
-        text_lower = text.lower()
-        
-        # List of transitional/connector words that are unlikely to appear in headings
-        transitional_words = [
-            'specifically,', 'however,', 'furthermore,', 'additionally,', 'therefore,',
-            'moreover,', 'consequently,', 'nevertheless,', 'nonetheless,', 'meanwhile,',
-            'subsequently,', 'similarly,', 'conversely,', 'alternatively,', 'accordingly,',
-            'hence,', 'thus,', 'indeed,', 'likewise,', 'otherwise,', 'namely,',
-            'for example,', 'for instance,', 'in particular,', 'in addition,', 'in contrast,',
-            'on the other hand,', 'as a result,', 'in conclusion,', 'in summary,',
-            'specifically ', 'however ', 'furthermore ', 'additionally ', 'therefore ',
-            'moreover ', 'consequently ', 'nevertheless ', 'nonetheless ', 'meanwhile ',
-            'subsequently ', 'similarly ', 'conversely ', 'alternatively ', 'accordingly ',
-            'hence ', 'thus ', 'indeed ', 'likewise ', 'otherwise ', 'namely '
-        ]
-        
-        # Check if any transitional words appear in the text
-        for word in transitional_words:
-            if word in text_lower:
-                return True
-        
-        return False
-    
-    # Helper function to check for "following" + ":" combination
-    def contains_following_with_colon(text):
-        """
-        Check if text contains both "following" and ":" which typically indicates 
-        introductory text rather than a heading.
-        """
-        text_lower = text.lower()
-        return 'following' in text_lower and ':' in text
-    
-    for group in filtered_groups:
-        group_text = group['text'].strip()
-        font_size = group['size']
-        is_heading = False
-        matched_criteria = []
-        
+    # Evaluate each inclusion criterion for all groups as parallel per-group columns; a
+    # group is a heading candidate if any column is set for it
+    group_texts = [group['text'].strip() for group in filtered_groups]
+    inclusion_columns = (
         # Criterion 1: Top 2 biggest font sizes
-        if font_size in top_2_sizes:
-            is_heading = True
-            matched_criteria.append("top_2_sizes")
-            criteria_matches['top_2_sizes'] += 1
-        
+        ("top_2_sizes", [group['size'] in top_2_size_set for group in filtered_groups]),
         # Criterion 2: Single words (no spaces after stripping)
-        if len(group_text.split()) == 1:
-            is_heading = True
-            matched_criteria.append("single_word")
-            criteria_matches['single_word'] += 1
-        
+        ("single_word", [len(group_text.split()) == 1 for group_text in group_texts]),
         # Criterion 3: Contains ':'
-        if ':' in group_text:
-            is_heading = True
-            matched_criteria.append("contains_colon")
-            criteria_matches['contains_colon'] += 1
-        
-        # Criterion 4: Contains a number or roman numeral
-        has_number = any(char.isdigit() for char in group_text)
-        has_roman = contains_roman_numeral(group_text)
-        if has_number or has_roman:
-            is_heading = True
-            matched_criteria.append("contains_number_or_roman")
-            criteria_matches['contains_number_or_roman'] += 1
-        
+        ("contains_colon", [':' in group_text for group_text in group_texts]),
+        # Criterion 4: Contains a number or roman numeral (the roman numeral regex only
+        # runs when there is no digit)
+        ("contains_number_or_roman", [
+            contains_digit(group_text) or contains_roman_numeral(group_text)
+            for group_text in group_texts
+        ]),
+    )
+    for criterion, column in inclusion_columns:
+        criteria_matches[criterion] = sum(column)
+    
+    criterion_names = [criterion for criterion, _ in inclusion_columns]
+    criterion_rows = zip(*(column for _, column in inclusion_columns))
+    
+    for group, group_text, criterion_flags in zip(filtered_groups, group_texts, criterion_rows):
         # Apply exclusion criteria - remove groups that match any exclusion rule
-        if is_heading:
+        if any(criterion_flags):
+            matched_criteria = [
+                criterion for criterion, matched in zip(criterion_names, criterion_flags) if matched
+            ]
+            # Lower-cased text for the exclusion checks (computed when the group was built,
+            # for groups from build_line_group)
+            group_text_lower = (group.get('text_lower') or group['text'].lower()).strip()
             excluded = False
             exclusion_reason = None
             
@@ -1358,13 +1590,13 @@ def apply_heading_filters(filtered_groups):
                 criteria_matches['excluded_fullstop_between'] += 1
             
             # Exclusion 4: Contains "following" and ":" combination
-            elif contains_following_with_colon(group_text):
+            elif contains_following_with_colon(group_text, group_text_lower):
                 excluded = True
                 exclusion_reason = "contains_following_with_colon"
                 criteria_matches['excluded_following_colon'] += 1
             
             # Exclusion 5: Contains transitional/connector words
-            elif contains_transitional_words(group_text):
+            elif contains_transitional_words(group_text, group_text_lower):
                 excluded = True
                 exclusion_reason = "contains_transitional_words"
                 criteria_matches['excluded_transitional_words'] += 1
@@ -1374,7 +1606,7 @@ def apply_heading_filters(filtered_groups):
                 heading_group = {
                     'text': group_text,
                     'page': group['page'],
-                    'size': font_size,
+                    'size': group['size'],
                     'matched_criteria': matched_criteria,
                     'x0': group['x0'],
                     'y0': group['y0'],
@@ -1385,314 +1617,234 @@ def apply_heading_filters(filtered_groups):
     # Sort by page first, then by y position
     heading_groups.sort(key=lambda x: (x['page'], x['y0']))
     
-    print(f"\nHeading criteria matches:")
-    print(f"  - Top 2 sizes: {criteria_matches['top_2_sizes']} groups")
-    print(f"  - Single word: {criteria_matches['single_word']} groups") 
-    print(f"  - Contains ':': {criteria_matches['contains_colon']} groups")
-    print(f"  - Contains number or roman: {criteria_matches['contains_number_or_roman']} groups")
-    print(f"\nExclusion criteria (filtered out):")
-    print(f"  - Starts with lowercase: {criteria_matches['excluded_lowercase']} groups")
-    print(f"  - Ends with full stop: {criteria_matches['excluded_fullstop_end']} groups")
-    print(f"  - Invalid full stop between: {criteria_matches['excluded_fullstop_between']} groups")
-    print(f"  - Contains 'following' + ':': {criteria_matches['excluded_following_colon']} groups")
-    print(f"  - Contains transitional words: {criteria_matches['excluded_transitional_words']} groups")
-    print(f"  - Total heading groups (after exclusions): {len(heading_groups)}")
+    log.debug("Heading criteria matches:")
+    log.debug("  - Top 2 sizes: %d groups", criteria_matches['top_2_sizes'])
+    log.debug("  - Single word: %d groups", criteria_matches['single_word'])
+    log.debug("  - Contains ':': %d groups", criteria_matches['contains_colon'])
+    log.debug("  - Contains number or roman: %d groups", criteria_matches['contains_number_or_roman'])
+    log.debug("Exclusion criteria (filtered out):")
+    log.debug("  - Starts with lowercase: %d groups", criteria_matches['excluded_lowercase'])
+    log.debug("  - Ends with full stop: %d groups", criteria_matches['excluded_fullstop_end'])
+    log.debug("  - Invalid full stop between: %d groups", criteria_matches['excluded_fullstop_between'])
+    log.debug("  - Contains 'following' + ':': %d groups", criteria_matches['excluded_following_colon'])
+    log.debug("  - Contains transitional words: %d groups", criteria_matches['excluded_transitional_words'])
+    log.info("Identified %d heading groups (after exclusions)", len(heading_groups))
     
     return heading_groups
 
 
-def create_json_data(heading_groups, title_text=""):
+def build_outline(heading_groups):
     """
-    Create JSON data structure from heading groups and title.
+    Build the outline entries for the heading groups, assigning heading levels by font size.
     
     Args:
         heading_groups: List of heading group dictionaries
-        title_text: Title of the document
     
     Returns:
-        Dictionary containing the JSON structure
+        List of outline entry dictionaries with level, text and page
     """
-    # Calculate heading levels based on font sizes
     if not heading_groups:
-        outline_data = {
-            "title": title_text,
-            "outline": []
-        }
-    else:
-        # Get unique font sizes and sort them in descending order (largest first)
-        font_sizes = list(set(group['size'] for group in heading_groups))
-        font_sizes.sort(reverse=True)
-        
-        # Create a mapping from font size to heading level (H1, H2, H3, etc.)
-        size_to_level = {}
-        for i, size in enumerate(font_sizes):
-            size_to_level[size] = f"H{i + 1}"
-        
-        print(f"\nHeading level mapping:")
-        for size in font_sizes:
-            print(f"  Font size {size:.1f}pt -> {size_to_level[size]}")
-        
-        outline_data = {
-            "title": title_text,
-            "outline": []
-        }
-        
-        for group in heading_groups:
-            outline_entry = {
-                "level": size_to_level[group['size']],
-                "text": group['text'],
-                "page": group['page'] - 1
-            }
-            outline_data["outline"].append(outline_entry)
+        return []
     
-    return outline_data
-
-
-def save_headings_to_json(heading_groups, title_text="", output_file="headings_outline.json"):
-    """
-    Save the identified headings to a JSON file in the specified format with heading levels.
+    # Get unique font sizes and sort them in descending order (largest first)
+    font_sizes = sorted({group['size'] for group in heading_groups}, reverse=True)
     
-    Args:
-        heading_groups: List of heading group dictionaries
-        title_text: Title of the document to include in the JSON
-        output_file: Output JSON file path
-    """
-    # Create JSON data using the helper function
-    outline_data = create_json_data(heading_groups, title_text)
+    # Create a mapping from font size to heading level (H1, H2, H3, etc.)
+    size_to_level = {size: f"H{i + 1}" for i, size in enumerate(font_sizes)}
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(outline_data, f, indent=4, ensure_ascii=False)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Heading level mapping:\n%s",
+                  "\n".join(f"  Font size {size:.1f}pt -> {size_to_level[size]}" for size in font_sizes))
     
-    print(f"\nSaved {len(heading_groups)} headings to {output_file}")
+    return [
+        {
+            "level": size_to_level[group['size']],
+            "text": group['text'],
+            "page": group['page'] - 1
+        }
+        for group in heading_groups
+    ]
 
 
-def create_initial_json_with_title(title_text="", output_file="headings_outline.json"):
+def create_json_data(heading_groups, title_text=""):
     """
-    Create an initial JSON file with just the title and empty outline.
-    This ensures we always have a JSON file even if no headings are found.
+    Create JSON data structure from heading groups and title.
     
     Args:
-        title_text: Title of the document to include in the JSON
-        output_file: Output JSON file path
+        heading_groups: List of heading group dictionaries
+        title_text: Title of the document
+    
+    Returns:
+        Dictionary containing the JSON structure
     """
-    outline_data = {
+    return {
         "title": title_text,
-        "outline": []
+        "outline": build_outline(heading_groups)
     }
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(outline_data, f, indent=4, ensure_ascii=False)
-    
-    print(f"Created initial JSON with title: '{title_text}' in {output_file}")
 
 
-def update_json_with_headings(heading_groups, output_file="headings_outline.json"):
+def save_headings_to_json(heading_groups, title_text="", output_file="headings_outline.json"):
     """
-    Update existing JSON file with headings. This function reads the existing JSON,
-    adds the headings to the outline, and saves it back.
+    Save the identified headings to a JSON file in the specified format with heading levels.
     
     Args:
         heading_groups: List of heading group dictionaries
+        title_text: Title of the document to include in the JSON
         output_file: Output JSON file path
     """
-    # Read existing JSON
-    try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            outline_data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # If file doesn't exist or is corrupted, create new structure
-        outline_data = {
-            "title": "",
-            "outline": []
-        }
-    
-    # Calculate heading levels based on font sizes
-    if heading_groups:
-        # Get unique font sizes and sort them in descending order (largest first)
-        font_sizes = list(set(group['size'] for group in heading_groups))
-        font_sizes.sort(reverse=True)
-        
-        # Create a mapping from font size to heading level (H1, H2, H3, etc.)
-        size_to_level = {}
-        for i, size in enumerate(font_sizes):
-            size_to_level[size] = f"H{i + 1}"
-        
-        print(f"\nHeading level mapping:")
-        for size in font_sizes:
-            print(f"  Font size {size:.1f}pt -> {size_to_level[size]}")
-        
-        # Add headings to outline
-        outline_data["outline"] = []
-        for group in heading_groups:
-            outline_entry = {
-                "level": size_to_level[group['size']],
-                "text": group['text'],
-                "page": group['page'] - 1
-            }
-            outline_data["outline"].append(outline_entry)
+    # Create JSON data using the helper function
+    outline_data = create_json_data(heading_groups, title_text)
     
-    # Save updated JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(outline_data, f, indent=4, ensure_ascii=False)
+    # Serialize once and write the UTF-8 bytes in a single call
+    with open(output_file, 'wb') as f:
+        f.write(json.dumps(outline_data, indent=4, ensure_ascii=False).encode('utf-8'))
     
-    print(f"\nUpdated JSON with {len(heading_groups)} headings in {output_file}")
+    log.info("Saved %d headings to %s", len(heading_groups), output_file)
 
 
 # Example usage - extracting text from page 1 (below y threshold) and all text from page 2 to end
 # pdf_file = "C:\\python\\adobe\\app\\input\\Nayan_CV2.pdf"
 # pdf_file = "C:\\python\\adobe\\app\\input\\E0CCG5S312.pdf"
 def heading_extracter_main(pdf_file, y_threshold=0 , title_data=None):
+    """
+    Extract the heading outline of a PDF.
+    
+    Args:
+        pdf_file: Path to the PDF file, or an already open fitz.Document (which is left open
+                  for the caller)
+        y_threshold: Only text below this y coordinate is considered on page 1
+        title_data: Title text of the document, if one was found
+    
+    Returns:
+        Dictionary containing the JSON structure (title and outline)
+    """
 
     # Extract title text from title_data if available
-    title_text = ""
-    if title_data:
-        title_text = title_data.strip()
+    title_text = title_data.strip() if title_data else ""
     
     # Set y coordinate threshold for page 1 - only extract text below this y coordinate on page 1
     page1_y_threshold = y_threshold  # Adjust this value as needed (e.g., 200 points from top)
 
-    print(f"Extracting text from page 1 (below y={page1_y_threshold}) and all text from page 2 to end: {pdf_file}")
-
-    # Extract data from page 1 to end (start_page=0 because it's 0-indexed), with y threshold for page 1
-    data = extract_fitz_data(pdf_file, start_page=0, page1_y_threshold=page1_y_threshold)
-
-    if data:
-        # Get page count info and page dimensions
-        doc = fitz.open(pdf_file)
+    # Open the PDF once, unless the caller already has it open: the spans, the page count and
+    # the page dimensions all come from it
+    owns_doc = not isinstance(pdf_file, fitz.Document)
+    with fitz.open(pdf_file) if owns_doc else nullcontext(pdf_file) as doc:
+        pdf_name = doc.name
+        log.debug("Extracting text from page 1 (below y=%s) and all text from page 2 to end: %s", page1_y_threshold, pdf_name)
+        
+        # Extract data from page 1 to end (start_page=0 because it's 0-indexed), with y threshold for page 1.
+        # Long documents are split across worker processes, which open their own copies.
         total_pages = len(doc)
+        if total_pages > PARALLEL_PAGE_THRESHOLD and pdf_name:
+            data = extract_fitz_data_parallel(doc, start_page=0, page1_y_threshold=page1_y_threshold)
+        else:
+            data = extract_fitz_data(doc, start_page=0, page1_y_threshold=page1_y_threshold)
         
-        # Get the actual page height from the first page
-        if len(doc) > 0:
-            first_page = doc[0]
-            page_rect = first_page.rect
+        # Get the actual page dimensions from the first page
+        if total_pages > 0:
+            page_rect = doc[0].rect
             page_height = page_rect.height
-            print(f"Page dimensions: {page_rect.width:.1f} x {page_height:.1f} points")
-        
-        doc.close()
+    
+    if data:
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        log.debug("Page dimensions: %.1f x %.1f points", page_rect.width, page_height)
         
-        print(f"\nFound {len(data)} text spans from page 1 (below y={page1_y_threshold}) and pages 2-{total_pages}")
+        log.debug("Found %d text spans from page 1 (below y=%s) and pages 2-%d", len(data), page1_y_threshold, total_pages)
         
-        # Print the metadata table for individual spans (first 50 only)
-        print("\n=== ALL EXTRACTED TEXT SPANS (First 50) ===")
-        pretty_print_metadata(data[:50])
+        # Log the metadata table for individual spans (first 50 only); the table needs the
+        # optional tabulate package
+        if debug_enabled and tabulate is not None:
+            log.debug("=== ALL EXTRACTED TEXT SPANS (First 50) ===\n%s", format_metadata_table(data[:50]))
 
         # Group spans by line position
-        print("\n=== GROUPED BY LINES ===")
         grouped_lines = group_spans_by_line(data)
-        print(f"Total grouped lines: {len(grouped_lines)}")
+        log.debug("Total grouped lines: %d", len(grouped_lines))
         
-        # # Print the grouped lines (first 50 only)
-        # print("\nGrouped lines (first 50):")
-        # for i, line in enumerate(grouped_lines[:50]):
-
-        # Print ALL the grouped lines
-        print(f"\nALL {len(grouped_lines)} grouped lines:")
-        for i, line in enumerate(grouped_lines):
-            print(f"Line {i+1}: '{line['text']}' (Page: {line['page']}, Size: {line['size']:.1f}pt, Y: {line['y0']:.1f}, Spans: {line['span_count']})")
+        # Log ALL the grouped lines
+        if debug_enabled:
+            log.debug("ALL %d grouped lines:", len(grouped_lines))
+            for i, line in enumerate(grouped_lines):
+                log.debug("Line %d: '%s' (Page: %d, Size: %.1fpt, Y: %.1f, Spans: %d)",
+                          i + 1, line['text'], line['page'], line['size'], line['y0'], line['span_count'])
         
         # Remove repetitive headers and footers
-        print("\n=== REMOVING REPETITIVE HEADERS/FOOTERS ===")
         filtered_lines = remove_headers_footers(grouped_lines, header_threshold=100, footer_threshold=100)
-        print(f"Lines after removing headers/footers: {len(filtered_lines)}")
+        log.debug("Lines after removing headers/footers: %d", len(filtered_lines))
         
         # Remove ordinal suffix lines
-        print("\n=== REMOVING ORDINAL SUFFIX LINES ===")
         filtered_lines = remove_ordinal_suffixes(filtered_lines)
-        print(f"Lines after removing ordinal suffixes: {len(filtered_lines)}")
+        log.debug("Lines after removing ordinal suffixes: %d", len(filtered_lines))
         
-        # Print the filtered lines (first 50 only)
-        print("\nFiltered lines (first 50):")
-        for i, line in enumerate(filtered_lines[:50]):
-            print(f"Line {i+1}: '{line['text']}' (Page: {line['page']}, Size: {line['size']:.1f}pt, Y: {line['y0']:.1f}, Spans: {line['span_count']})")
+        # Log the filtered lines (first 50 only)
+        if debug_enabled:
+            log.debug("Filtered lines (first 50):")
+            for i, line in enumerate(filtered_lines[:50]):
+                log.debug("Line %d: '%s' (Page: %d, Size: %.1fpt, Y: %.1f, Spans: %d)",
+                          i + 1, line['text'], line['page'], line['size'], line['y0'], line['span_count'])
         
         # Filter groups by starting position (remove center/right-aligned groups)
-        print("\n=== FILTERING GROUPS BY STARTING POSITION ===")
         position_filtered_lines = filter_groups_by_starting_position(filtered_lines, center_threshold_ratio=0.5)
-        print(f"Lines after position filtering: {len(position_filtered_lines)}")
+        log.debug("Lines after position filtering: %d", len(position_filtered_lines))
         
         # Group consecutive lines by font size
-        print("\n=== GROUPED BY CONSECUTIVE FONT SIZES (WITH PARAGRAPH BREAKS) ===")
         consecutive_groups = group_consecutive_lines_by_size(position_filtered_lines, paragraph_gap_threshold=20)
-        print(f"Total consecutive font size groups: {len(consecutive_groups)}")
+        log.debug("Total consecutive font size groups: %d", len(consecutive_groups))
         
         # Filter groups by line count (remove multi-line groups)
-        print("\n=== FILTERING GROUPS BY LINE COUNT ===")
         line_count_filtered_groups = filter_groups_by_line_count(consecutive_groups, max_lines=1)
-        print(f"Groups after line count filtering: {len(line_count_filtered_groups)}")
+        log.debug("Groups after line count filtering: %d", len(line_count_filtered_groups))
         
         # Filter groups by page position (remove groups near bottom of page)
-        print("\n=== FILTERING GROUPS BY PAGE POSITION ===")
         page_position_filtered_groups = filter_groups_by_page_position(line_count_filtered_groups, page_height=page_height)
-        print(f"Groups after page position filtering: {len(page_position_filtered_groups)}")
+        log.debug("Groups after page position filtering: %d", len(page_position_filtered_groups))
         
         # Filter groups by copyright content (remove copyright notices)
-        print("\n=== FILTERING GROUPS BY COPYRIGHT CONTENT ===")
         copyright_filtered_groups = filter_groups_by_copyright(page_position_filtered_groups)
-        print(f"Groups after copyright filtering: {len(copyright_filtered_groups)}")
+        log.debug("Groups after copyright filtering: %d", len(copyright_filtered_groups))
         
         # Filter duplicate headings across pages (remove repetitive headings that appear on multiple pages)
-        print("\n=== FILTERING DUPLICATE HEADINGS ACROSS PAGES ===")
         duplicate_filtered_groups = filter_duplicate_headings_across_pages(copyright_filtered_groups, total_pages=total_pages)
-        print(f"Groups after duplicate filtering: {len(duplicate_filtered_groups)}")
+        log.debug("Groups after duplicate filtering: %d", len(duplicate_filtered_groups))
         
         # Filter page numbers, dates, and table of contents references
-        print("\n=== FILTERING PAGE NUMBERS, DATES, AND TOC REFERENCES ===")
         page_date_filtered_groups = filter_page_numbers_dates_toc(duplicate_filtered_groups)
-        print(f"Groups after page/date/TOC filtering: {len(page_date_filtered_groups)}")
-        
-        # Print all the final filtered groups
-        print(f"\nFinal filtered groups (potential headings, showing all {len(page_date_filtered_groups)}):")
-        for i, group in enumerate(page_date_filtered_groups):
-            reason_info = f" [Reason: {group.get('reason', 'unknown')}]" if group.get('reason') else ""
-            print(f"Group {i+1}: (Page: {group['page']}, Size: {group['size']:.1f}pt, Lines: {group['line_count']}, X-start: {group['x0']:.1f}){reason_info}")
-            print(f"  Combined text: '{group['text']}'")
-            print("-" * 80)
-        
-        # Apply heading filters and save to JSON
-        print("\n" + "="*80)
-        print("APPLYING HEADING FILTERS")
-        print("="*80)
-        
-        # First filter out interrupting non-numbered headings
-        print("\n=== FILTERING INTERRUPTING NON-NUMBERED HEADINGS ===")
+        log.debug("Groups after page/date/TOC filtering: %d", len(page_date_filtered_groups))
+        
+        # Log all the final filtered groups
+        if debug_enabled:
+            log.debug("Final filtered groups (potential headings, showing all %d):", len(page_date_filtered_groups))
+            for i, group in enumerate(page_date_filtered_groups):
+                reason_info = f" [Reason: {group['reason']}]" if group.get('reason') else ""
+                log.debug("Group %d: (Page: %d, Size: %.1fpt, Lines: %d, X-start: %.1f)%s",
+                          i + 1, group['page'], group['size'], group['line_count'], group['x0'], reason_info)
+                log.debug("  Combined text: '%s'", group['text'])
+        
+        # Apply heading filters; first filter out interrupting non-numbered headings
         structure_filtered_groups = filter_interrupting_non_numbered_headings(page_date_filtered_groups)
-        print(f"Groups after structure filtering: {len(structure_filtered_groups)}")
+        log.debug("Groups after structure filtering: %d", len(structure_filtered_groups))
         
         heading_groups = apply_heading_filters(structure_filtered_groups)
         
         # Create JSON data structure
-        title_text = ""
-        if title_data:
-            title_text = title_data.strip()
-        
         json_data = create_json_data(heading_groups, title_text)
         
-        # Print the identified headings with recalculated font sizes and height calculations
-        print(f"\nIdentified headings (showing all {len(heading_groups)}):")
-        for i, heading in enumerate(heading_groups):
-            criteria_str = ", ".join(heading['matched_criteria'])
-            
-            # Recalculate font size based on the original data
-            # Find the original text spans that match this heading
-            original_font_size = heading['size']  # Keep original as fallback
-            
-            
-            # Calculate height for this individual heading from its own coordinates
-            # The heading group should have y0 and y1 coordinates from the group_consecutive_lines_by_size function
-            if 'y1' in heading:
-                individual_height = heading['y1'] - heading['y0']
-                height_info = f", Height: {individual_height:.5f}pt"
-            else:
-                height_info = ""
-            
-            print(f"Heading {i+1}: '{heading['text']}' , Original: {original_font_size:.4f}pt,{height_info}) ")
+        # Log the identified headings with their font sizes and height calculations
+        if debug_enabled:
+            log.debug("Identified headings (showing all %d):", len(heading_groups))
+            for i, heading in enumerate(heading_groups):
+                # Calculate height for this individual heading from its own coordinates
+                # The heading group should have y0 and y1 coordinates from the group_consecutive_lines_by_size function
+                if 'y1' in heading:
+                    individual_height = heading['y1'] - heading['y0']
+                    height_info = f", Height: {individual_height:.5f}pt"
+                else:
+                    height_info = ""
+                
+                log.debug("Heading %d: '%s' , Original: %.4fpt,%s) ", i + 1, heading['text'], heading['size'], height_info)
         
         return json_data
 
     else:
-        print("No text data found from page 2 onwards")
+        log.warning("No text data found in %s", pdf_name)
         # Return JSON with title only
-        title_text = ""
-        if title_data:
-            title_text = title_data.strip()
         return create_json_data([], title_text)
@@ -1,9 +1,18 @@
 import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Import the processing function
 from processing import process_single_pdf
 
+def configure_logging():
+    """Show the extraction summaries (INFO and above) on stderr, tagged with the worker
+    process that logged them. Also run in every worker, which does not inherit the
+    configuration when processes are spawned rather than forked."""
+    logging.basicConfig(level=logging.INFO, format="%(processName)s %(levelname)s %(name)s: %(message)s")
+
 def process_pdfs():
     # Get input and output directories
     input_dir = Path("app/input")
@@ -12,8 +21,9 @@ def process_pdfs():
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Get all PDF files
-    pdf_files = list(input_dir.glob("*.pdf"))
+    # Get all PDF files; scandir gives the names and file types without a stat per path
+    with os.scandir(input_dir) as entries:
+        pdf_files = [entry for entry in entries if entry.name.endswith(".pdf") and entry.is_file()]
     
     if not pdf_files:
         print("No PDF files found in the input directory.")
@@ -24,31 +34,44 @@ def process_pdfs():
     successful_count = 0
     failed_count = 0
     
-    for pdf_file in pdf_files:
-        print(f"\n{'='*80}")
-        print(f"PROCESSING: {pdf_file.name}")
-        print(f"{'='*80}")
-        
-        # Process the PDF and get JSON data
-        json_data = process_single_pdf(str(pdf_file))
+    # Each PDF is independent and CPU-bound, so they are processed in separate worker
+    # processes; results come back to this process, which writes the JSON files
+    max_workers = min(os.cpu_count() or 1, len(pdf_files))
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_logging) as executor:
+        futures = {executor.submit(process_single_pdf, pdf_file.path): pdf_file for pdf_file in pdf_files}
         
-        if json_data is not None:
-            # Create output JSON file
-            output_file = output_dir / f"{pdf_file.stem}.json"
+        for future in as_completed(futures):
+            pdf_file = futures[future]
             
+            # Get the JSON data of the processed PDF
             try:
-                with open(output_file, "w", encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                
-                print(f"✅ Successfully processed {pdf_file.name} -> {output_file.name}")
-                successful_count += 1
-                
+                json_data = future.result()
             except Exception as e:
-                print(f"❌ Error saving JSON for {pdf_file.name}: {str(e)}")
+                print(f"❌ Error processing {pdf_file.name}: {str(e)}")
+                failed_count += 1
+                continue
+            
+            if json_data is not None:
+                # Create output JSON file
+                output_file = output_dir / f"{os.path.splitext(pdf_file.name)[0]}.json"
+                
+                try:
+                    # Serialize in one call and write the whole document at once as UTF-8
+                    # bytes; json.dump with an indent issues a separate write for every token
+                    json_bytes = json.dumps(json_data, indent=2, ensure_ascii=False).encode('utf-8')
+                    with open(output_file, "wb") as f:
+                        f.write(json_bytes)
+                    
+                    print(f"✅ Successfully processed {pdf_file.name} -> {output_file.name}")
+                    successful_count += 1
+                    
+                except Exception as e:
+                    print(f"❌ Error saving JSON for {pdf_file.name}: {str(e)}")
+                    failed_count += 1
+            else:
+                print(f"❌ Failed to process {pdf_file.name}")
                 failed_count += 1
-        else:
-            print(f"❌ Failed to process {pdf_file.name}")
-            failed_count += 1
     
     print(f"\n{'='*80}")
     print(f"PROCESSING SUMMARY")
@@ -58,6 +81,7 @@ def process_pdfs():
     print(f"Failed: {failed_count}")
 
 if __name__ == "__main__":
+    configure_logging()
     print("Starting processing pdfs")
     process_pdfs() 
     print("Completed processing pdfs")
\ No newline at end of file
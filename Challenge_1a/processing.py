@@ -1,5 +1,8 @@
 import os
 import json
+import logging
+
+import fitz  # PyMuPDF
 
 # Import functions from title_extracter
 from title_extracter import (
@@ -11,6 +14,8 @@ from header_extracter import (
     heading_extracter_main
 )
 
+log = logging.getLogger(__name__)
+
 
 def process_single_pdf(pdf_file_path):
     """
@@ -24,34 +29,31 @@ def process_single_pdf(pdf_file_path):
     """
     try:
         # Step 1: Extract title and get its lower y coordinate using title_extract_fitz_data
-        print("="*80)
-        print(f"STEP 1: EXTRACTING TITLE FROM {pdf_file_path}")
-        print("="*80)
-
-        # Extract data from first page only
-        title_data, title_lower_y = title_extract_main(pdf_file_path)
-
-        if not title_data:
-            print("No text data found on first page")
-            title_lower_y = 200  # Default fallback
-
-        # Add buffer below title
-        page1_y_threshold = title_lower_y + 10
-        
-        # Extract data from page 1 to end with y threshold for page 1
-        json_data = heading_extracter_main(pdf_file_path, page1_y_threshold, title_data)
+        # (runs in pool workers, so progress goes through the logger, one record per line)
+        log.info("Extracting title from %s", pdf_file_path)
+
+        # Open the PDF once and share it between title and heading extraction
+        with fitz.open(pdf_file_path) as doc:
+            # Extract data from first page only
+            title_data, title_lower_y = title_extract_main(doc)
+
+            if not title_data:
+                log.info("No title found on the first page of %s", pdf_file_path)
+                title_lower_y = 200  # Default fallback
+
+            # Add buffer below title
+            page1_y_threshold = title_lower_y + 10
+            
+            # Extract data from page 1 to end with y threshold for page 1
+            json_data = heading_extracter_main(doc, page1_y_threshold, title_data)
         
-        # Process the header data through the filtering pipeline
-        print("="*80)
-        print("Processing completed successfully!")
-        print("="*80)
+        log.info("Processed %s", pdf_file_path)
         
         return json_data
         
-    except Exception as e:
-        print(f"\nError processing PDF {pdf_file_path}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # The traceback is only formatted if a handler emits the record
+        log.exception("Error processing PDF %s", pdf_file_path)
         return None
 
 
@@ -64,7 +66,7 @@ def main_execution():
         pdf_file = "C:\\python\\adobe\\app\\input\\file01.pdf"  # Replace with your PDF file path
 
         # Extract data from first page only
-        title_data , title_lower_y = title_extract_main(pdf_file)
+        title_data , title_lower_y = title_extract_main(pdf_file, verbose=True)
 
         if not title_data:
             print("No text data found on first page")
@@ -82,16 +84,17 @@ def main_execution():
         print("="*80)
         print("Processing completed successfully!")
         print("="*80)
-        print("Generated JSON data:")
-        print(json.dumps(json_data, indent=2, ensure_ascii=False))
+        # Serializing the whole outline again is only worth it when it will be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Generated JSON data:\n%s", json.dumps(json_data, indent=2, ensure_ascii=False))
         
-    except Exception as e:
-        print(f"\nError processing PDF: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("Error processing PDF")
 
 
 if __name__ == "__main__":
+    # Manual single-file run: show every diagnostic, including the generated JSON
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(name)s: %(message)s")
     main_execution()
 
 
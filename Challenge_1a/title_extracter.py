@@ -1,40 +1,59 @@
 import fitz  # PyMuPDF
 from collections import defaultdict
-
-def truncate_middle(text, max_len=40):
-    if len(text) <= max_len:
-        return text
-    keep = max_len // 2 - 2
-    return f"{text[:keep]}...{text[-keep:]}"
-
-
-def pretty_print_metadata(data):
-    from tabulate import tabulate
-
-    table_data = []
-    for item in data:
-        table_data.append([
-            truncate_middle(item['text']),
-            '✔' if item['bold'] else '❌',
-            round(item['size'], 2),
-            round(item['x0'], 2),
-            round(item['y0'], 2),
-            round(item['x1'], 2),
-            round(item['y1'], 2),
-            '✔' if item['centered'] else '❌'
-        ])
-
-    headers = ['Text', 'Bold', 'Size', 'x0', 'y0', 'x1', 'y1', 'Centered']
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+from functools import lru_cache
+from itertools import groupby
+import re
+import sys
+
+# Extraction flags, bold font check and span table dump shared with the heading extractor
+from header_extracter import TEXT_EXTRACTION_FLAGS, is_bold_font, pretty_print_metadata
+
+# Reference page used by the title alignment checks: standard letter size (612 x 792 points)
+PAGE_WIDTH = 612
+PAGE_CENTER = PAGE_WIDTH / 2
+
+# Text that should not be combined with other text to form a title (URLs, emails, phone
+# numbers, addresses, ...). Matched against the stripped, upper-cased text.
+NON_TITLE_PATTERNS = (
+    # URLs and web-related patterns
+    r'WWW\.',                    # Starts with WWW.
+    r'HTTP[S]?://',             # HTTP or HTTPS URLs
+    r'\.(COM|ORG|NET|EDU|GOV)', # Common domain extensions
+    r'@.*\.(COM|ORG|NET)',      # Email patterns
+    # Phone number patterns
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Phone numbers like 123-456-7890
+    r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}',  # Phone numbers like (123) 456-7890
+    # Other non-title patterns
+    r'^[A-Z0-9\-\.]+\.(COM|ORG|NET|EDU|GOV)$',  # Domain-like text
+    r'^\d+\s*(ST|ND|RD|TH)?\s+(STREET|ST|AVENUE|AVE|ROAD|RD|BLVD)',  # Address patterns
+    r'(?<![A-Z])[A-Z]{2,}\s+\d{5}',  # State and ZIP code patterns
+)
+
+# Characters of meaningless special character sequences, typically decorative elements like
+# dashes, underscores, asterisks, etc. Text made up only of these is not a title.
+SPECIAL_CHARACTERS = frozenset(
+    '-_=*+~`^|\\/<>'  # Dashes, underscores, equals, asterisks, etc.
+    '•·▪▫◦‣⁃'        # Bullet points and similar symbols
+    '─━┄┅┈┉┊┋'       # Various line drawing characters
+    '.,:;!?'         # Dots, commas and other punctuation
+)
+
+# The non-title patterns compiled once into a single alternation, so a check is one regex call.
+# The ZIP code pattern starts with an unbounded letter run, so it is anchored at the start
+# of the run: a match inside a run also matches from its start, and without the lookbehind
+# a search rescans the run from every position in it (quadratic on long words).
+NON_TITLE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in NON_TITLE_PATTERNS))
 
 
 def extract_fitz_data(pdf_path):
-    """Extract text, font, bbox and centered info using pymupdf."""
-    doc = fitz.open(pdf_path)
-    page = doc[0]  # first page
+    """Extract text, font, bbox and centered info of the first page using pymupdf.
+    pdf_path may also be an already open fitz.Document, which is left open for the caller."""
+    owns_doc = not isinstance(pdf_path, fitz.Document)
+    doc = fitz.open(pdf_path) if owns_doc else pdf_path
+    page = doc.load_page(0)  # first page only
 
     page_width = page.rect.width
-    blocks = page.get_text("dict")["blocks"]
+    blocks = page.get_text("dict", flags=TEXT_EXTRACTION_FLAGS)["blocks"]
 
     results = []
 
@@ -45,12 +64,16 @@ def extract_fitz_data(pdf_path):
             for span in line["spans"]:
                 x0, y0, x1, y1 = span["bbox"]
                 text = span["text"]
-                font = span.get("font", "")
+                # Interned so the spans share one string per font name, which the bold font
+                # cache and later font comparisons then match by identity
+                font = sys.intern(span.get("font", ""))
                 size = span.get("size", 0.0)
-                centered = abs((x0 + x1)/2 - page_width/2) < 10  # margin threshold
+                # |midpoint - page centre| < 10, compared on the doubled values so no
+                # halving is needed (scaling by 2 is exact, so the result is identical)
+                centered = abs(x0 + x1 - page_width) < 20  # margin threshold
 
                 # Determine if font is bold based on font name
-                bold = 'Bold' in font or 'bold' in font.lower()
+                bold = is_bold_font(font)
 
                 results.append({
                     "text": text,
@@ -63,6 +86,9 @@ def extract_fitz_data(pdf_path):
                     "y1": y1,
                     "centered": centered
                 })
+
+    if owns_doc:
+        doc.close()
     return results
 
 
@@ -70,26 +96,27 @@ def group_spans_by_line(data, y_threshold=2.0):
     """
     Group text spans that are on the same line (similar y0 and y1 values).
     """
-    grouped_lines = defaultdict(list)
+    # Line key of every span: y0 and y1 rounded to the y_threshold grid
+    line_keys = [
+        (round(item['y0'] / y_threshold), round(item['y1'] / y_threshold))
+        for item in data
+    ]
     
-    for item in data:
-        # Create a key based on rounded y0 and y1 values
-        y0_key = round(item['y0'] / y_threshold) * y_threshold
-        y1_key = round(item['y1'] / y_threshold) * y_threshold
-        line_key = (y0_key, y1_key)
-        
-        grouped_lines[line_key].append(item)
+    # One stable sort by (line key, x0) replaces the per-line buckets and sorts:
+    # spans of the same line become adjacent and ordered left to right
+    order = sorted(range(len(data)), key=lambda i: (line_keys[i], data[i]['x0']))
     
-    # Sort each line by x0 position and merge text
     result = []
-    for line_key, spans in grouped_lines.items():
-        spans.sort(key=lambda x: x['x0'])  # Sort left to right
+    for line_key, line_indices in groupby(order, key=line_keys.__getitem__):
+        line_indices = list(line_indices)
+        spans = [data[i] for i in line_indices]
         
-        # Merge spans on the same line
-        merged_text = ' '.join(span['text'].strip() for span in spans if span['text'].strip())
+        # Merge spans on the same line, stripping each span's text once
+        stripped_texts = [span['text'].strip() for span in spans]
+        merged_text = ' '.join([text for text in stripped_texts if text])
         
         if merged_text:  # Only include non-empty lines
-            result.append({
+            line = {
                 'text': merged_text,
                 'y0': spans[0]['y0'],
                 'y1': spans[0]['y1'],
@@ -100,13 +127,16 @@ def group_spans_by_line(data, y_threshold=2.0):
                 'bold': any(span['bold'] for span in spans),
                 'centered': spans[0]['centered'],
                 'span_count': len(spans)
-            })
+            }
+            # Remember where the line first appears so ties keep document order
+            result.append((line['y0'], min(line_indices), line))
     
     # Sort by y position (top to bottom)
-    result.sort(key=lambda x: x['y0'])
-    return result
+    result.sort(key=lambda entry: entry[:2])
+    return [entry[2] for entry in result]
 
 
+@lru_cache(maxsize=256)
 def is_meaningful_title(text):
     """
     Check if text is a meaningful title by filtering out:
@@ -120,56 +150,27 @@ def is_meaningful_title(text):
     if len(text) < 3:
         return False
     
-    # Must contain at least one letter
-    if not any(c.isalpha() for c in text):
+    # Must contain at least one letter (str.isalpha mapped in C, no per-character frame)
+    if not any(map(str.isalpha, text)):
         return False
     
-    # Must have at least 2 words for a good title (optional)
-    words = text.split()
-    if len(words) < 2 and len(text) < 10:  # Single word must be at least 10 chars
+    # Must have at least 2 words for a good title (optional); only short text needs splitting
+    if len(text) < 10 and len(text.split()) < 2:  # Single word must be at least 10 chars
         return False
     
     return True
 
 
+@lru_cache(maxsize=256)
 def is_non_title_text(text):
     """
     Check if text should not be combined with other text to form a title.
     This includes URLs, emails, phone numbers, and other non-title elements.
     """
-    import re
-    
     text = text.strip().upper()
     
-    # Check for URLs and web-related patterns
-    url_patterns = [
-        r'WWW\.',                    # Starts with WWW.
-        r'HTTP[S]?://',             # HTTP or HTTPS URLs
-        r'\.(COM|ORG|NET|EDU|GOV)', # Common domain extensions
-        r'@.*\.(COM|ORG|NET)',      # Email patterns
-    ]
-    
-    # Check for phone number patterns
-    phone_patterns = [
-        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Phone numbers like 123-456-7890
-        r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}',  # Phone numbers like (123) 456-7890
-    ]
-    
-    # Check for other non-title patterns
-    other_patterns = [
-        r'^[A-Z0-9\-\.]+\.(COM|ORG|NET|EDU|GOV)$',  # Domain-like text
-        r'^\d+\s*(ST|ND|RD|TH)?\s+(STREET|ST|AVENUE|AVE|ROAD|RD|BLVD)',  # Address patterns
-        r'[A-Z]{2,}\s+\d{5}',       # State and ZIP code patterns
-    ]
-    
-    all_patterns = url_patterns + phone_patterns + other_patterns
-    
     # Check if text matches any non-title pattern
-    for pattern in all_patterns:
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    return NON_TITLE_RE.search(text) is not None
 
 
 def are_whole_texts_single_title(text1, text2, max_vertical_distance=50, alignment_threshold=100):
@@ -200,9 +201,8 @@ def are_whole_texts_single_title(text1, text2, max_vertical_distance=50, alignme
     horizontal_distance = abs(text1_center - text2_center)
     
     # Check if both texts are centered on the page
-    page_center = 306  # 612/2 for standard letter size
-    text1_from_center = abs(text1_center - page_center)
-    text2_from_center = abs(text2_center - page_center)
+    text1_from_center = abs(text1_center - PAGE_CENTER)
+    text2_from_center = abs(text2_center - PAGE_CENTER)
     
     # Criteria for being a single title:
     # 1. Texts are close vertically (already checked)
@@ -239,9 +239,8 @@ def are_lines_single_title(line1, line2, max_vertical_distance=30, alignment_thr
     horizontal_distance = abs(line1_center - line2_center)
     
     # Check if both lines are centered on the page
-    page_center = 306  # 612/2 for standard letter size
-    line1_from_center = abs(line1_center - page_center)
-    line2_from_center = abs(line2_center - page_center)
+    line1_from_center = abs(line1_center - PAGE_CENTER)
+    line2_from_center = abs(line2_center - PAGE_CENTER)
     
     # Criteria for being a single title:
     # 1. Lines are close vertically (already checked)
@@ -260,46 +259,44 @@ def is_special_character_text(text):
     Check if text contains only meaningless permutations of special characters.
     These are typically decorative elements like dashes, underscores, asterisks, etc.
     """
-    import re
-    
     text = text.strip()
     if not text:
         return True
     
-    # Define patterns for meaningless special character sequences
-    special_char_patterns = [
-        r'^[-_=*+~`^|\\/<>]{3,}$',  # Sequences of dashes, underscores, equals, asterisks, etc.
-        r'^[•·▪▫◦‣⁃]{3,}$',        # Bullet points and similar symbols
-        r'^[─━┄┅┈┉┊┋]{3,}$',       # Various line drawing characters
-        r'^[.]{3,}$',               # Multiple dots (ellipsis-like)
-        r'^[,]{3,}$',               # Multiple commas
-        r'^[;]{3,}$',               # Multiple semicolons
-        r'^[:]{3,}$',               # Multiple colons
-        r'^[!]{3,}$',               # Multiple exclamation marks
-        r'^[?]{3,}$',               # Multiple question marks
-        r'^[\s]*[-_=*+~`^|\\/<>•·▪▫◦‣⁃─━┄┅┈┉┊┋.,:;!?]+[\s]*$',  # Mixed special chars with optional whitespace
-    ]
-    
-    # Check if the text matches any special character pattern
-    for pattern in special_char_patterns:
-        if re.match(pattern, text):
-            return True
-    
-    return False
+    # Check if the text consists only of special characters (a set scan instead of a regex)
+    return SPECIAL_CHARACTERS.issuperset(text)
 
 
-def group_texts_by_font_size(data, sort_by_y=True):
+def group_texts_by_font_size(data, sort_by_y=True, *, return_groups=False):
+    """
+    Join the text of the lines of each font size (rounded to 0.1pt).
     
+    Args:
+        data: Lines from group_spans_by_line
+        sort_by_y: Join the lines of each size top to bottom, left to right
+        return_groups: Also return the lines of every size
+    
+    Returns:
+        dict: size -> whole text, for the sizes that pass the filters. With return_groups,
+              a tuple of that dict and size -> lines of that size, in their original order
+    """
     grouped = defaultdict(list)
 
+    # round(size, 1) is comparatively slow and a page only has a handful of distinct sizes,
+    # so each distinct size is rounded once
+    size_keys = {}
     for item in data:
-        size_key = round(item['size'], 1)
+        size = item['size']
+        size_key = size_keys.get(size)
+        if size_key is None:
+            size_key = size_keys[size] = round(size, 1)
         grouped[size_key].append(item)
 
     result = {}
     for size, items in grouped.items():
+        # Sorted into a new list, so the grouping keeps the lines in their original order
         if sort_by_y:
-            items.sort(key=lambda x: (x['y0'], x['x0']))
+            items = sorted(items, key=lambda x: (x['y0'], x['x0']))
 
         full_text = ' '.join(x['text'] for x in items if x['text'].strip()).strip()
 
@@ -308,63 +305,107 @@ def group_texts_by_font_size(data, sort_by_y=True):
             not is_special_character_text(full_text)):
             result[size] = full_text
 
+    if return_groups:
+        return result, grouped
     return result
 
 
-
+def lines_bounding_box(lines):
+    """
+    Compute the bounding box that encompasses all the given lines, and whether any of them
+    is bold, in a single pass.
+    
+    Args:
+        lines: Non-empty list of line dictionaries
+    
+    Returns:
+        Tuple of (min x0, min y0, max x1, max y1, any bold)
+    """
+    first_line = lines[0]
+    min_x0, min_y0 = first_line['x0'], first_line['y0']
+    max_x1, max_y1 = first_line['x1'], first_line['y1']
+    any_bold = bool(first_line['bold'])
+    
+    for line in lines[1:]:
+        if line['x0'] < min_x0:
+            min_x0 = line['x0']
+        if line['y0'] < min_y0:
+            min_y0 = line['y0']
+        if line['x1'] > max_x1:
+            max_x1 = line['x1']
+        if line['y1'] > max_y1:
+            max_y1 = line['y1']
+        if line['bold']:
+            any_bold = True
+    
+    return min_x0, min_y0, max_x1, max_y1, any_bold
 
 
 # Example usage
 # pdf_file = "C:\\python\\adobe\\app\\input\\E0CCG5S239.pdf"
-def title_extract_main(pdf_file):
+def title_extract_main(pdf_file, verbose=False):
+    """
+    Extract the document title from the first page of a PDF.
+
+    Args:
+        pdf_file: Path to the PDF file, or an already opened fitz.Document
+        verbose: Print the span table and the step-by-step analysis
+
+    Returns:
+        tuple: (title, lower y coordinate of the title), or (None, None) if no title was found
+    """
     data = extract_fitz_data(pdf_file)
 
     # Now use `data` everywhere
-    pretty_print_metadata(data)
+    if verbose:
+        pretty_print_metadata(data)
 
     # Step 1: First group spans by line position (same y0 and y1 values)
-    print("\n\n=== STEP 1: GROUP SPANS BY LINE POSITION ===")
     grouped_lines = group_spans_by_line(data)
-    print(f"Total grouped lines: {len(grouped_lines)}")
 
-    # Display some line grouping examples
-    print("\nFirst 5 grouped lines:")
-    for i, line in enumerate(grouped_lines[:5]):
-        print(f"  Line {i+1}: '{line['text']}' (Size: {line['size']:.1f}pt, Y: {line['y0']:.1f}, Spans: {line['span_count']})")
+    if verbose:
+        print("\n\n=== STEP 1: GROUP SPANS BY LINE POSITION ===")
+        print(f"Total grouped lines: {len(grouped_lines)}")
+
+        # Display some line grouping examples
+        print("\nFirst 5 grouped lines:")
+        for i, line in enumerate(grouped_lines[:5]):
+            print(f"  Line {i+1}: '{line['text']}' (Size: {line['size']:.1f}pt, Y: {line['y0']:.1f}, Spans: {line['span_count']})")
 
     # Step 2: Then group the lines by font size
-    print("\n\n=== STEP 2: GROUP LINES BY FONT SIZE ===")
-    grouped_texts = group_texts_by_font_size(grouped_lines)
+    grouped_texts, lines_by_size = group_texts_by_font_size(grouped_lines, return_groups=True)
+
+    if verbose:
+        print("\n\n=== STEP 2: GROUP LINES BY FONT SIZE ===")
 
-    # Print grouped text
-    print("\nGrouped Texts by Font Size:\n")
-    for size in sorted(grouped_texts.keys(), reverse=True):  # largest font first
-        print(f"[Font Size: {size} pt]")
-        print(grouped_texts[size])
-        print("-" * 80)
+        # Print grouped text
+        print("\nGrouped Texts by Font Size:\n")
+        for size in sorted(grouped_texts.keys(), reverse=True):  # largest font first
+            print(f"[Font Size: {size} pt]")
+            print(grouped_texts[size])
+            print("-" * 80)
 
     # Step 3: Get top 2 whole texts from 2 biggest font sizes
-    print("\n\n=== STEP 3: EXTRACT TOP 2 WHOLE TEXTS FROM 2 BIGGEST FONT SIZES ===")
+    if verbose:
+        print("\n\n=== STEP 3: EXTRACT TOP 2 WHOLE TEXTS FROM 2 BIGGEST FONT SIZES ===")
     font_sizes = sorted(grouped_texts.keys(), reverse=True)
 
     if len(font_sizes) >= 2:
         top_2_font_sizes = font_sizes[:2]
-        print(f"Top 2 font sizes: {top_2_font_sizes}")
+        if verbose:
+            print(f"Top 2 font sizes: {top_2_font_sizes}")
         
         # Extract the whole text for each of the top 2 font sizes
         top_2_texts = []
         for i, font_size in enumerate(top_2_font_sizes):
             whole_text = grouped_texts[font_size]
             
-            # Find all lines that contribute to this font size and calculate combined bounding box
-            contributing_lines = [line for line in grouped_lines if round(line['size'], 1) == font_size]
+            # Lines that contribute to this font size (already grouped by group_texts_by_font_size)
+            contributing_lines = lines_by_size[font_size]
             
             if contributing_lines:
                 # Calculate the bounding box that encompasses all contributing lines
-                min_x0 = min(line['x0'] for line in contributing_lines)
-                max_x1 = max(line['x1'] for line in contributing_lines)
-                min_y0 = min(line['y0'] for line in contributing_lines)
-                max_y1 = max(line['y1'] for line in contributing_lines)
+                min_x0, min_y0, max_x1, max_y1, any_bold = lines_bounding_box(contributing_lines)
                 
                 # Get other properties from the first line (assuming consistent within font size)
                 first_line = contributing_lines[0]
@@ -378,14 +419,15 @@ def title_extract_main(pdf_file):
                     'y0': min_y0,
                     'y1': max_y1,
                     'font': first_line['font'],
-                    'bold': any(line['bold'] for line in contributing_lines),
+                    'bold': any_bold,
                     'centered': first_line['centered'],
                     'contributing_lines': len(contributing_lines)
                 })
                 
-                print(f"Rank {i+1}: Font Size {font_size}pt -> '{whole_text}'")
-                print(f"  Bounding box: x0={min_x0:.1f}, y0={min_y0:.1f}, x1={max_x1:.1f}, y1={max_y1:.1f}")
-                print(f"  Contributing lines: {len(contributing_lines)}")
+                if verbose:
+                    print(f"Rank {i+1}: Font Size {font_size}pt -> '{whole_text}'")
+                    print(f"  Bounding box: x0={min_x0:.1f}, y0={min_y0:.1f}, x1={max_x1:.1f}, y1={max_y1:.1f}")
+                    print(f"  Contributing lines: {len(contributing_lines)}")
             else:
                 # Fallback if no contributing lines found
                 top_2_texts.append({
@@ -401,23 +443,22 @@ def title_extract_main(pdf_file):
                     'centered': False,
                     'contributing_lines': 0
                 })
-                print(f"Rank {i+1}: Font Size {font_size}pt -> '{whole_text}' (No bounding box data)")
+                if verbose:
+                    print(f"Rank {i+1}: Font Size {font_size}pt -> '{whole_text}' (No bounding box data)")
         
-        print(f"\nExtracted {len(top_2_texts)} whole texts from top 2 font sizes")
+        if verbose:
+            print(f"\nExtracted {len(top_2_texts)} whole texts from top 2 font sizes")
         
     elif len(font_sizes) == 1:
         font_size = font_sizes[0]
         whole_text = grouped_texts[font_size]
         
-        # Find all lines that contribute to this font size and calculate combined bounding box
-        contributing_lines = [line for line in grouped_lines if round(line['size'], 1) == font_size]
+        # Lines that contribute to this font size (already grouped by group_texts_by_font_size)
+        contributing_lines = lines_by_size[font_size]
         
         if contributing_lines:
             # Calculate the bounding box that encompasses all contributing lines
-            min_x0 = min(line['x0'] for line in contributing_lines)
-            max_x1 = max(line['x1'] for line in contributing_lines)
-            min_y0 = min(line['y0'] for line in contributing_lines)
-            max_y1 = max(line['y1'] for line in contributing_lines)
+            min_x0, min_y0, max_x1, max_y1, any_bold = lines_bounding_box(contributing_lines)
             
             # Get other properties from the first line
             first_line = contributing_lines[0]
@@ -431,14 +472,15 @@ def title_extract_main(pdf_file):
                 'y0': min_y0,
                 'y1': max_y1,
                 'font': first_line['font'],
-                'bold': any(line['bold'] for line in contributing_lines),
+                'bold': any_bold,
                 'centered': first_line['centered'],
                 'contributing_lines': len(contributing_lines)
             }]
             
-            print(f"Only 1 font size found: {font_size}pt -> '{whole_text}'")
-            print(f"  Bounding box: x0={min_x0:.1f}, y0={min_y0:.1f}, x1={max_x1:.1f}, y1={max_y1:.1f}")
-            print(f"  Contributing lines: {len(contributing_lines)}")
+            if verbose:
+                print(f"Only 1 font size found: {font_size}pt -> '{whole_text}'")
+                print(f"  Bounding box: x0={min_x0:.1f}, y0={min_y0:.1f}, x1={max_x1:.1f}, y1={max_y1:.1f}")
+                print(f"  Contributing lines: {len(contributing_lines)}")
         else:
             top_2_texts = [{
                 'font_size': font_size,
@@ -453,41 +495,45 @@ def title_extract_main(pdf_file):
                 'centered': False,
                 'contributing_lines': 0
             }]
-            print(f"Only 1 font size found: {font_size}pt -> '{whole_text}' (No bounding box data)")
+            if verbose:
+                print(f"Only 1 font size found: {font_size}pt -> '{whole_text}' (No bounding box data)")
     else:
         top_2_texts = []
-        print("No font sizes found")
+        if verbose:
+            print("No font sizes found")
 
     # Analyze title extraction
-    print("\n\n=== TITLE ANALYSIS ===")
-    page_width = 612  # Standard letter size
-    page_height = 792
+    if verbose:
+        print("\n\n=== TITLE ANALYSIS ===")
 
     # Filter for potential titles (top 2 font sizes)
     if len(top_2_texts) >= 2:
-        print(f"Analyzing top 2 whole texts:")
-        print(f"  Text 1 (Rank 1): '{top_2_texts[0]['text']}' (Size: {top_2_texts[0]['font_size']:.1f}pt)")
-        print(f"    Bounding box: x0={top_2_texts[0]['x0']:.1f}, y0={top_2_texts[0]['y0']:.1f}, x1={top_2_texts[0]['x1']:.1f}, y1={top_2_texts[0]['y1']:.1f}")
-        print(f"  Text 2 (Rank 2): '{top_2_texts[1]['text']}' (Size: {top_2_texts[1]['font_size']:.1f}pt)")
-        print(f"    Bounding box: x0={top_2_texts[1]['x0']:.1f}, y0={top_2_texts[1]['y0']:.1f}, x1={top_2_texts[1]['x1']:.1f}, y1={top_2_texts[1]['y1']:.1f}")
+        if verbose:
+            print(f"Analyzing top 2 whole texts:")
+            print(f"  Text 1 (Rank 1): '{top_2_texts[0]['text']}' (Size: {top_2_texts[0]['font_size']:.1f}pt)")
+            print(f"    Bounding box: x0={top_2_texts[0]['x0']:.1f}, y0={top_2_texts[0]['y0']:.1f}, x1={top_2_texts[0]['x1']:.1f}, y1={top_2_texts[0]['y1']:.1f}")
+            print(f"  Text 2 (Rank 2): '{top_2_texts[1]['text']}' (Size: {top_2_texts[1]['font_size']:.1f}pt)")
+            print(f"    Bounding box: x0={top_2_texts[1]['x0']:.1f}, y0={top_2_texts[1]['y0']:.1f}, x1={top_2_texts[1]['x1']:.1f}, y1={top_2_texts[1]['y1']:.1f}")
         
         # Title selection logic: Check if the two whole texts can form a single title
         text1 = top_2_texts[0]
         text2 = top_2_texts[1]
         
         can_combine, reason = are_whole_texts_single_title(text1, text2)
-        print(f"\nTitle combination analysis:")
-        print(f"Whole Text 1: '{text1['text']}' (Size: {text1['font_size']:.1f}pt)")
-        print(f"Whole Text 2: '{text2['text']}' (Size: {text2['font_size']:.1f}pt)")
-        print(f"Can combine: {can_combine}")
-        print(f"Reason: {reason}")
+        if verbose:
+            print(f"\nTitle combination analysis:")
+            print(f"Whole Text 1: '{text1['text']}' (Size: {text1['font_size']:.1f}pt)")
+            print(f"Whole Text 2: '{text2['text']}' (Size: {text2['font_size']:.1f}pt)")
+            print(f"Can combine: {can_combine}")
+            print(f"Reason: {reason}")
         
         if can_combine:
             combined_title = f"{text1['text']} {text2['text']}"
             # Use the lower y coordinate of the second text (bottom-most)
             title_lower_y = max(text1['y1'], text2['y1'])
-            print(f"\nFinal title: '{combined_title}' (Combined from top 2 whole texts)")
-            print(f"Title lower y coordinate: {title_lower_y:.1f}")
+            if verbose:
+                print(f"\nFinal title: '{combined_title}' (Combined from top 2 whole texts)")
+                print(f"Title lower y coordinate: {title_lower_y:.1f}")
             selected_title = combined_title
             selected_lower_y = title_lower_y
         else:
@@ -497,35 +543,42 @@ def title_extract_main(pdf_file):
             if meaningful_texts:
                 selected_title = meaningful_texts[0]['text']
                 selected_lower_y = meaningful_texts[0]['y1']
-                print(f"\nFinal title: '{selected_title}' (Most meaningful from top 2 whole texts)")
-                print(f"Title lower y coordinate: {selected_lower_y:.1f}")
+                if verbose:
+                    print(f"\nFinal title: '{selected_title}' (Most meaningful from top 2 whole texts)")
+                    print(f"Title lower y coordinate: {selected_lower_y:.1f}")
             else:
                 # Fall back to largest font size whole text
                 selected_title = top_2_texts[0]['text']
                 selected_lower_y = top_2_texts[0]['y1']
-                print(f"\nFinal title: '{selected_title}' (Largest font size whole text)")
-                print(f"Title lower y coordinate: {selected_lower_y:.1f}")
+                if verbose:
+                    print(f"\nFinal title: '{selected_title}' (Largest font size whole text)")
+                    print(f"Title lower y coordinate: {selected_lower_y:.1f}")
 
     elif len(top_2_texts) == 1:
         selected_title = top_2_texts[0]['text']
         selected_lower_y = top_2_texts[0]['y1']
-        print(f"\nFinal title: '{selected_title}' (Only one whole text available)")
-        print(f"Title lower y coordinate: {selected_lower_y:.1f}")
+        if verbose:
+            print(f"\nFinal title: '{selected_title}' (Only one whole text available)")
+            print(f"Title lower y coordinate: {selected_lower_y:.1f}")
     else:
-        print("\nNo title candidates found")
+        if verbose:
+            print("\nNo title candidates found")
         selected_title = None
         selected_lower_y = None
 
     # Final result summary
-    print("\n" + "="*60)
-    print("TITLE EXTRACTION RESULT")
-    print("="*60)
+    if verbose:
+        print("\n" + "="*60)
+        print("TITLE EXTRACTION RESULT")
+        print("="*60)
     if selected_title:
-        print(f"Title: {selected_title}")
-        print(f"Lower Y Coordinate: {selected_lower_y:.1f}")
+        if verbose:
+            print(f"Title: {selected_title}")
+            print(f"Lower Y Coordinate: {selected_lower_y:.1f}")
         return selected_title, selected_lower_y
     else:
-        print("No title extracted")
+        if verbose:
+            print("No title extracted")
         return None, None
     print("="*60)
 